@@ -1,5 +1,12 @@
+import os
 from setuptools import setup, find_packages
 
+# Opt-in native build of the validation fast paths: THERANGE_MYPYC=1 pip install .
+ext_modules = []
+if os.environ.get("THERANGE_MYPYC"):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["therange/_fastvalidate.py"])
+
 setup(
     name="therange-sdk",
     version="0.2",
@@ -7,5 +14,7 @@ setup(
     author="Your Name",
     packages=find_packages(),
     install_requires=["requests", "pydantic"],
+    extras_require={"async": ["aiohttp>=3.8"], "fast": ["orjson>=3.9"], "http2": ["httpx[http2]>=0.24"], "stream": ["ijson>=3.1"]},
     python_requires=">=3.7",
+    ext_modules=ext_modules,
 )
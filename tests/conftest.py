@@ -0,0 +1,201 @@
+"""
+Shared pytest fixtures for The Range Marketplace SDK test suite.
+
+The e2e fixtures authenticate against the live UAT environment once per test
+session and hand the same authenticated manager to every e2e test, so the
+suite pays for a single login round-trip instead of one per test.
+
+When pytest-recording is installed, e2e traffic is recorded to YAML cassettes
+under ``tests/cassettes`` on the first run and replayed from them afterwards,
+so replays need neither credentials nor network access. Pass
+``--record-mode=rewrite`` to re-record against UAT.
+"""
+
+import logging
+import os
+import re
+import uuid
+import pytest
+import requests
+from datetime import datetime, timedelta
+from therange import TheRangeManager, Config
+from therange.auth import clear_auth_cache
+
+
+_UAT_CONFIG = Config.uat()
+E2E_SKIP_REASON = "E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
+NETWORK_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+# Record missing cassettes, replay existing ones; --record-mode overrides this
+DEFAULT_RECORD_MODE = "once"
+_KSI_COOKIE = re.compile(r"ksi=[^;]+")
+
+
+def _recording_enabled(config):
+    """Return True when pytest-recording is installed and not disabled."""
+    return config.pluginmanager.hasplugin("recording") and not config.getoption("--disable-recording")
+
+
+def _record_mode(config):
+    """Return the effective VCR record mode for this run."""
+    return config.getoption("--record-mode") or DEFAULT_RECORD_MODE
+
+
+def _has_cassette(item):
+    """Return True when the e2e test can be replayed from a recorded cassette."""
+    from pytest_recording.plugin import get_default_cassette_name
+
+    name = get_default_cassette_name(item.cls, item.name)
+    module = os.path.splitext(os.path.basename(str(item.path)))[0]
+    return (
+        os.path.exists(os.path.join(CASSETTE_DIR, module, f"{name}.yaml"))
+        and os.path.exists(os.path.join(CASSETTE_DIR, "manager.yaml"))
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every non-e2e test as a unit test, and skip e2e tests up front
+    when UAT credentials are missing and there is nothing to replay."""
+    e2e_items = []
+    for item in items:
+        if item.get_closest_marker("e2e"):
+            e2e_items.append(item)
+        else:
+            item.add_marker(pytest.mark.unit)
+
+    if os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD"):
+        return
+    replaying = _recording_enabled(config) and _record_mode(config) in ("none", "once")
+    skip_e2e = pytest.mark.skip(reason=E2E_SKIP_REASON)
+    for item in e2e_items:
+        if not (replaying and _has_cassette(item)):
+            item.add_marker(skip_e2e)
+
+
+def _scrub_request(request):
+    """Keep UAT credentials out of recorded cassettes."""
+    if request.path.endswith("authenticate.api"):
+        request.body = b'{"user": "REDACTED", "pass": "REDACTED"}'
+    return request
+
+
+def _scrub_response(response):
+    """Replace the recorded session cookie with a placeholder that still replays."""
+    headers = response["headers"]
+    for name in headers:
+        if name.lower() == "set-cookie":
+            headers[name] = [_KSI_COOKIE.sub("ksi=REDACTED", value) for value in headers[name]]
+    return response
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Report UAT network failures in e2e tests as skips rather than errors."""
+    try:
+        return (yield)
+    except NETWORK_ERRORS as e:
+        if not item.get_closest_marker("e2e"):
+            raise
+        pytest.skip(f"Network issue - cannot reach UAT API: {e}")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_auth_cache():
+    """Keep logins cached by one test from leaking into the next."""
+    clear_auth_cache()
+    yield
+    clear_auth_cache()
+
+
+@pytest.fixture(scope="session")
+def uat_credentials():
+    """Return the UAT (username, password) pair from the environment."""
+    return os.getenv("THERANGE_USERNAME"), os.getenv("THERANGE_PASSWORD")
+
+
+@pytest.fixture(scope="session")
+def uat_config():
+    """Return the shared UAT configuration."""
+    return _UAT_CONFIG
+
+
+@pytest.fixture
+def assert_api_response(request):
+    """Check the API returned a JSON object and log it at DEBUG level to the test module's logger."""
+    log = logging.getLogger(request.module.__name__)
+    def _assert(response, label):
+        assert isinstance(response, dict), f"{label}: expected dict, got {type(response).__name__}"
+        log.debug("%s: %s", label, response)
+    return _assert
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    """VCR settings shared by every recorded e2e test.
+
+    Request bodies are not matched because e2e payloads carry fresh UUIDs on
+    every run; requests to the same endpoint replay in recorded order.
+    """
+    return {
+        "record_mode": DEFAULT_RECORD_MODE,
+        "filter_headers": ["authorization", "cookie"],
+        "match_on": ["method", "scheme", "host", "port", "path", "query"],
+        "before_record_request": _scrub_request,
+        "before_record_response": _scrub_response,
+    }
+
+
+@pytest.fixture(scope="session")
+def manager(request, uat_credentials):
+    """TheRangeManager authenticated once against UAT and shared by all e2e tests."""
+    username, password = uat_credentials
+    manager = TheRangeManager(username, password, _UAT_CONFIG)
+    try:
+        if _recording_enabled(request.config):
+            import vcr
+
+            recorder = vcr.VCR(
+                cassette_library_dir=CASSETTE_DIR,
+                **{**request.getfixturevalue("vcr_config"), "record_mode": _record_mode(request.config)},
+            )
+            with recorder.use_cassette("manager.yaml"):
+                _connect(manager)
+        else:
+            _connect(manager)
+    except NETWORK_ERRORS as e:
+        pytest.skip(f"Network issue - cannot reach UAT API: {e}")
+    yield manager
+
+
+def _connect(manager):
+    """Probe reachability, leaving a negotiated TLS connection in the pool, then authenticate."""
+    manager.auth.session.get(manager.auth.base_url, timeout=10)
+    manager.authenticate()
+
+
+@pytest.fixture
+def stock_item_factory():
+    """Build a stock row with a collision-free E2E code; keyword arguments override fields."""
+    def _make(prefix="E2E_STOCK", **overrides):
+        item = {"code": f"{prefix}_{uuid.uuid4().hex[:8]}", "qty": 1}
+        item.update(overrides)
+        return item
+    return _make
+
+
+@pytest.fixture
+def dispatch_factory():
+    """Build dispatch_order keyword arguments for a unique E2E order; keyword arguments override fields."""
+    def _make(**overrides):
+        reference = uuid.uuid4().hex[:8]
+        kwargs = {
+            "order_number": f"E2E_TEST_{reference}",
+            "items": [{"code": "E2E_TEST_PRODUCT", "qty": 1}],
+            "despatch_date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            "delivery_service": "Standard",
+            "courier_name": "E2E Test Courier",
+            "tracking_reference": f"TR_E2E_{reference}",
+        }
+        kwargs.update(overrides)
+        return kwargs
+    return _make
@@ -0,0 +1,164 @@
+"""
+Unit tests for the async_client module.
+
+Tests the httpx-based async manager against a mocked client, so httpx itself
+is not required to run them.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from requests import Request
+from requests.cookies import cookiejar_from_dict, get_cookie_header
+from therange.config import Config
+from therange.async_client import AsyncTheRangeManager
+
+
+def _response(status_code=200, body=None, cookies=None):
+    """Return a mocked httpx response."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(body if body is not None else {}).encode()
+    response.text = "Bad input"
+    response.cookies = cookiejar_from_dict(cookies or {})
+    response.headers = {}
+    return response
+
+
+def _mock_client(*responses):
+    """Return a mocked httpx.AsyncClient whose post() yields the given responses in turn."""
+    client = MagicMock()
+    client.post = AsyncMock(side_effect=list(responses))
+    client.cookies = cookiejar_from_dict({})
+    return client
+
+
+def _posted(client, index=0):
+    """Return the (url, decoded JSON body) of a recorded post call."""
+    call = client.post.call_args_list[index]
+    return call.args[0], json.loads(call.kwargs["content"])
+
+
+class TestAsyncAuthClient:
+    """Test AsyncAuthClient authentication."""
+
+    def test_authenticate_success(self):
+        """Test a login records ksi, mode and supplier_id and sets the ksi cookie on the client."""
+        client = _mock_client(_response(body={"mode": "test", "supplier_id": 12345}, cookies={"ksi": "async_ksi"}))
+        manager = AsyncTheRangeManager("user", "pass", Config.uat(), client=client)
+
+        data = asyncio.run(manager.authenticate())
+
+        assert data == {"mode": "test", "supplier_id": 12345}
+        assert manager.auth.ksi == "async_ksi"
+        assert manager.auth.mode == "test"
+        assert manager.auth.supplier_id == "12345"
+        assert client.cookies.get("ksi") == "async_ksi"
+        assert _posted(client) == (
+            "https://uatsupplier.rstore.com/rest/authenticate.api", {"user": "user", "pass": "pass"}
+        )
+
+    def test_authenticate_scopes_ksi_cookie_to_api_host(self):
+        """Test the ksi cookie replaces any earlier one and is only sent to the API host."""
+        client = _mock_client(_response(body={"mode": "test", "supplier_id": 1}, cookies={"ksi": "async_ksi"}))
+        client.cookies.set("ksi", "stale_ksi")
+        manager = AsyncTheRangeManager("user", "pass", Config.uat(), client=client)
+
+        asyncio.run(manager.authenticate())
+
+        assert client.cookies.get("ksi") == "async_ksi"
+        api = Request("POST", "https://uatsupplier.rstore.com/rest/order_ack.api").prepare()
+        other = Request("GET", "https://other.example.com/").prepare()
+        assert get_cookie_header(client.cookies, api) == "ksi=async_ksi"
+        assert get_cookie_header(client.cookies, other) is None
+
+    def test_authenticate_invalid_credentials(self):
+        """Test a 401 login raises PermissionError."""
+        client = _mock_client(_response(status_code=401))
+        manager = AsyncTheRangeManager("user", "wrong", Config.uat(), client=client)
+
+        with pytest.raises(PermissionError, match="Unauthorized: Invalid credentials"):
+            asyncio.run(manager.authenticate())
+
+    def test_authenticate_missing_ksi_cookie(self):
+        """Test a login without a ksi cookie raises RuntimeError."""
+        client = _mock_client(_response(body={"mode": "test", "supplier_id": 1}))
+        manager = AsyncTheRangeManager("user", "pass", Config.uat(), client=client)
+
+        with pytest.raises(RuntimeError, match="Authentication failed: 'ksi' cookie missing"):
+            asyncio.run(manager.authenticate())
+
+    def test_aclose_leaves_caller_client_open(self):
+        """Test aclose() does not close a client the caller passed in."""
+        client = _mock_client()
+        client.aclose = AsyncMock()
+
+        asyncio.run(AsyncTheRangeManager("user", "pass", Config.uat(), client=client).aclose())
+
+        client.aclose.assert_not_called()
+
+
+class TestAsyncClients:
+    """Test the async order acknowledgement and order event clients."""
+
+    def _manager(self, *responses):
+        client = _mock_client(*responses)
+        manager = AsyncTheRangeManager("user", "pass", Config.uat(), client=client)
+        manager.auth.ksi = "test_ksi"
+        manager.auth.supplier_id = "12345"
+        manager.auth.mode = "test"
+        return manager, client
+
+    def test_acknowledge_orders_bulk_gathers_chunks(self):
+        """Test bulk acknowledgement sends one request per chunk and keeps chunk order."""
+        manager, client = self._manager(*(_response(body={"n": i}) for i in range(3)))
+
+        result = asyncio.run(manager.order_ack.acknowledge_orders_bulk([f"ORDER{i}" for i in range(5)], chunk_size=2))
+
+        assert result == [{"n": 0}, {"n": 1}, {"n": 2}]
+        url, payload = _posted(client)
+        assert url == "https://uatsupplier.rstore.com/rest/order_ack.api?supplier_id=12345"
+        assert payload == {"order_arr": ["ORDER0", "ORDER1"], "mode": "test"}
+        assert [_posted(client, i)[1]["order_arr"] for i in range(3)] == [
+            ["ORDER0", "ORDER1"], ["ORDER2", "ORDER3"], ["ORDER4"]
+        ]
+
+    def test_acknowledge_orders_requires_authentication(self):
+        """Test acknowledging before authenticate() raises ValueError without sending."""
+        manager, client = self._manager()
+        manager.auth.ksi = None
+
+        with pytest.raises(ValueError, match="Must be authenticated before making this call"):
+            asyncio.run(manager.order_ack.acknowledge_orders(["ORDER1"]))
+        client.post.assert_not_called()
+
+    def test_dispatch_orders_returns_exceptions_in_place(self):
+        """Test concurrent dispatches return each response or exception in input order."""
+        # ORD3 gets a 401 and the re-login attempt is rejected too
+        manager, client = self._manager(_response(body={"ok": 1}), _response(status_code=401), _response(status_code=401))
+        dispatch = {
+            "items": [{"code": "TEST123", "qty": 1}],
+            "despatch_date": "2023-12-15 14:30:00",
+            "delivery_service": "Standard",
+            "courier_name": "Test Courier",
+            "tracking_reference": "TR123",
+        }
+
+        results = asyncio.run(manager.order_event.dispatch_orders([
+            {**dispatch, "order_number": "ORD1"},
+            {**dispatch, "order_number": "ORD2", "items": []},
+            {**dispatch, "order_number": "ORD3"},
+        ]))
+
+        assert results[0] == {"ok": 1}
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], PermissionError)
+        assert _posted(client)[1]["item_arr"] == [{"code": "TEST123", "qty": 1}]
+
+    def test_cancel_order_400_raises_value_error(self):
+        """Test a 400 response surfaces as ValueError with the response text."""
+        manager, client = self._manager(_response(status_code=400))
+
+        with pytest.raises(ValueError, match="Bad request: Bad input"):
+            asyncio.run(manager.order_event.cancel_order("ORD1", [{"code": "A", "qty": 1}], "Stock not available"))
@@ -0,0 +1,109 @@
+"""
+Unit tests for the AsyncStockAvailabilityClient module.
+
+Tests async stock updates using a mocked aiohttp-style session, so aiohttp
+itself is not required to run them.
+"""
+
+import asyncio
+import json
+import sys
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from therange.auth import AuthClient
+from therange.config import Config
+from therange.async_stock_availability import AsyncStockAvailabilityClient
+
+
+def _mock_session(status=200, json_body=None, text="OK"):
+    """Return a mocked aiohttp session whose post() yields a response with the given status."""
+    response = MagicMock(status=status)
+    response.read = AsyncMock(return_value=json.dumps(json_body).encode())
+    response.text = AsyncMock(return_value=text)
+    session = MagicMock()
+    session.post.return_value.__aenter__.return_value = response
+    session.close = AsyncMock()
+    return session
+
+
+class TestAsyncStockAvailabilityClient:
+    """Test AsyncStockAvailabilityClient update_stock functionality."""
+    
+    def setup_method(self):
+        """Set up an authenticated AuthClient without network I/O."""
+        self.auth = AuthClient("test_user", "test_pass", Config.production())
+        self.auth.ksi = "test_ksi"
+        self.auth.supplier_id = "12345"
+        self.auth.base_url = "https://test.example.com/rest/"
+    
+    def test_update_stock_success(self):
+        """Test a validated batch is posted as JSON bytes to the cached endpoint."""
+        session = _mock_session(json_body={"status": "success"})
+        client = AsyncStockAvailabilityClient(self.auth, session=session)
+        stock_data = [{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": "0"}]
+        
+        result = asyncio.run(client.update_stock(stock_data))
+        
+        assert result == {"status": "success"}
+        call_args = session.post.call_args
+        assert call_args.args[0] == "https://test.example.com/rest/stock_availability.api?supplier_id=12345"
+        assert json.loads(call_args.kwargs['data']) == [{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": 0}]
+        assert call_args.kwargs['headers'] == {"Content-Type": "application/json"}
+        assert call_args.kwargs['cookies'] == {"ksi": "test_ksi"}
+    
+    def test_update_stock_client_session_sends_current_ksi(self, monkeypatch):
+        """Test a client-created session sends the ksi current at each request, not at creation."""
+        session = _mock_session(json_body={"status": "success"})
+        monkeypatch.setitem(sys.modules, "aiohttp", SimpleNamespace(ClientSession=MagicMock(return_value=session)))
+        client = AsyncStockAvailabilityClient(self.auth)
+        
+        asyncio.run(client.update_stock([{"code": "PROD123", "qty": 1}]))
+        self.auth.ksi = "relogin_ksi"
+        asyncio.run(client.update_stock([{"code": "PROD123", "qty": 2}]))
+        
+        assert [c.kwargs['cookies'] for c in session.post.call_args_list] == [
+            {"ksi": "test_ksi"}, {"ksi": "relogin_ksi"}
+        ]
+    
+    def test_update_stock_not_authenticated(self):
+        """Test update_stock requires an authenticated AuthClient."""
+        self.auth.ksi = None
+        session = _mock_session()
+        client = AsyncStockAvailabilityClient(self.auth, session=session)
+        
+        with pytest.raises(ValueError, match="Must be authenticated before making this call"):
+            asyncio.run(client.update_stock([{"code": "PROD123", "qty": 1}]))
+        session.post.assert_not_called()
+    
+    def test_update_stock_invalid_data(self):
+        """Test invalid rows are rejected before any request."""
+        session = _mock_session()
+        client = AsyncStockAvailabilityClient(self.auth, session=session)
+        
+        with pytest.raises(ValueError, match="Invalid stock data:"):
+            asyncio.run(client.update_stock([{"code": "PROD123", "qty": -1}]))
+        session.post.assert_not_called()
+    
+    @pytest.mark.parametrize("status, error, match", [
+        (401, PermissionError, "Not authenticated."),
+        (400, ValueError, "Bad request: Invalid stock payload"),
+    ])
+    def test_update_stock_http_errors(self, status, error, match):
+        """Test HTTP errors map to the same exceptions as the sync client."""
+        session = _mock_session(status=status, text="Invalid stock payload")
+        client = AsyncStockAvailabilityClient(self.auth, session=session)
+        
+        with pytest.raises(error, match=match):
+            asyncio.run(client.update_stock([{"code": "PROD123", "qty": 1}]))
+    
+    def test_aclose_leaves_caller_session_open(self):
+        """Test a caller-supplied session is not closed by the client."""
+        session = _mock_session()
+        
+        async def use_client():
+            async with AsyncStockAvailabilityClient(self.auth, session=session):
+                pass
+        
+        asyncio.run(use_client())
+        session.close.assert_not_called()
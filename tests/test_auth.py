@@ -5,10 +5,17 @@ Tests authentication functionality including initialization, successful auth,
 and various error scenarios using mocked HTTP requests.
 """
 
+import dataclasses
+import json
 import pytest
 import requests
-from unittest.mock import Mock, patch
+import sys
+from http.client import HTTPMessage
+from types import SimpleNamespace
+from unittest.mock import ANY, Mock, patch
+from requests.cookies import cookiejar_from_dict
 from therange.auth import AuthClient
+from therange.base_client import BaseClient
 from therange.config import Config
 
 
@@ -27,6 +34,37 @@ class TestAuthClientInitialization:
         assert auth.mode is None
         assert auth.supplier_id is None
         assert auth.ksi is None
+
+    def test_init_mounts_pooled_adapter(self):
+        """Test that the session shares one pooled, retrying adapter for http and https."""
+        config = Config.production()
+        auth = AuthClient("test_user", "test_pass", config)
+
+        https_adapter = auth.session.get_adapter("https://supplier.rstore.com/rest/")
+        http_adapter = auth.session.get_adapter("http://supplier.rstore.com/rest/")
+
+        assert https_adapter is http_adapter
+        assert https_adapter._pool_maxsize == 32
+        assert https_adapter.max_retries.total == 3
+        assert https_adapter.max_retries.status_forcelist == (502, 503, 504)
+        assert "POST" in https_adapter.max_retries.allowed_methods
+        assert auth.session.headers["Connection"] == "keep-alive"
+
+    def test_init_pool_size_from_config(self):
+        """Test the adapter pool is sized from Config.pool_maxsize and requests carry a User-Agent."""
+        config = Config(Config.UAT, pool_maxsize=64)
+        auth = AuthClient("test_user", "test_pass", config)
+        
+        assert auth.session.get_adapter("https://uatsupplier.rstore.com/rest/")._pool_maxsize == 64
+        assert auth.session.headers["User-Agent"].startswith("therange-sdk/")
+    
+    def test_init_with_existing_session(self):
+        """Test that a caller-supplied session is used as-is."""
+        config = Config.production()
+        session = requests.Session()
+        auth = AuthClient("test_user", "test_pass", config, session=session)
+        
+        assert auth.session is session
     
     def test_init_test_mode(self):
         """Test initialization with test mode enabled."""
@@ -42,6 +80,44 @@ class TestAuthClientInitialization:
         assert auth.ksi is None
 
 
+class TestAuthClientEndpoints:
+    """Test AuthClient cached endpoint URLs."""
+    
+    def test_endpoints_without_supplier_id(self):
+        """Test the stock endpoint is unset until a supplier_id is known."""
+        auth = AuthClient("test_user", "test_pass", Config.uat())
+        
+        assert auth.endpoints.authenticate_url == "https://uatsupplier.rstore.com/rest/authenticate.api"
+        assert auth.endpoints.stock_url is None
+    
+    def test_endpoints_follow_supplier_id_and_base_url(self):
+        """Test endpoints are rebuilt when supplier_id or base_url change."""
+        auth = AuthClient("test_user", "test_pass", Config.uat())
+        auth.supplier_id = "12345"
+        auth.base_url = "https://test.example.com/rest/"
+        
+        assert auth.endpoints.authenticate_url == "https://test.example.com/rest/authenticate.api"
+        assert auth.endpoints.stock_url == "https://test.example.com/rest/stock_availability.api?supplier_id=12345"
+    
+    def test_endpoints_are_immutable(self):
+        """Test compiled endpoints cannot be modified in place."""
+        auth = AuthClient("test_user", "test_pass", Config.uat())
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            auth.endpoints.stock_url = "https://elsewhere.example.com/"
+    
+    def test_ready_follows_session_and_supplier_id(self):
+        """Test the cached ready flag needs both a session and a supplier_id."""
+        auth = AuthClient("test_user", "test_pass", Config.uat())
+        assert not auth._ready
+        
+        auth.supplier_id = "12345"
+        assert auth._ready
+        
+        auth.session = None
+        assert not auth._ready
+
+
 class TestAuthClientAuthentication:
     """Test AuthClient authentication functionality."""
     
@@ -51,17 +127,16 @@ class TestAuthClientAuthentication:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=test_ksi_value; Path=/"}
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict({"ksi": "test_ksi_value"})
+        mock_response.content = json.dumps({
             "mode": "test_mode",
             "supplier_id": 12345
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -72,15 +147,15 @@ class TestAuthClientAuthentication:
         # Verify request was made correctly
         expected_url = "https://uatsupplier.rstore.com/rest/authenticate.api"
         expected_payload = {"user": "test_user", "pass": "test_pass"}
-        mock_session.post.assert_called_once_with(expected_url, json=expected_payload)
-        
-        # Verify cookie was set
-        mock_session.cookies.set.assert_called_once_with("ksi", "test_ksi_value")
+        mock_session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_session.post.call_args.kwargs['data']) == expected_payload
         
         # Verify auth state was updated
         assert auth.ksi == "test_ksi_value"
         assert auth.mode == "test_mode"
         assert auth.supplier_id == "12345"
+        assert auth.supplier_id is sys.intern("12345")
+        assert auth.endpoints.stock_url.endswith("stock_availability.api?supplier_id=12345")
         
         # Verify return value
         assert result == {"mode": "test_mode", "supplier_id": 12345}
@@ -93,7 +168,7 @@ class TestAuthClientAuthentication:
         mock_response.status_code = 401
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -113,7 +188,7 @@ class TestAuthClientAuthentication:
         mock_response.text = "Invalid request format"
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -130,11 +205,12 @@ class TestAuthClientAuthentication:
         # Setup mock response without ksi cookie
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "other_cookie=value; Path=/"}
+        mock_response.cookies = cookiejar_from_dict({"other_cookie": "value"})
+        mock_response.headers = {"Set-Cookie": "other_cookie=value; Path=/; HttpOnly"}
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -151,11 +227,12 @@ class TestAuthClientAuthentication:
         # Setup mock response without Set-Cookie header
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.cookies = cookiejar_from_dict({})
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -175,7 +252,7 @@ class TestAuthClientAuthentication:
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -192,17 +269,16 @@ class TestAuthClientAuthentication:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=test_ksi_value; Path=/"}
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict({"ksi": "test_ksi_value"})
+        mock_response.content = json.dumps({
             "mode": "test_mode",
             "supplier_id": None
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -220,17 +296,16 @@ class TestAuthClientAuthentication:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=test_ksi_value; Path=/"}
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict({"ksi": "test_ksi_value"})
+        mock_response.content = json.dumps({
             "mode": "test_mode",
             "supplier_id": 67890
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -248,16 +323,15 @@ class TestAuthClientAuthentication:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=test_ksi_value; Path=/"}
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict({"ksi": "test_ksi_value"})
+        mock_response.content = json.dumps({
             "supplier_id": 12345
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -280,19 +354,18 @@ class TestAuthClientEdgeCases:
         # Setup mock response with multiple cookies
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {
-            "Set-Cookie": "session=abc123; Path=/; ksi=test_ksi_value; HttpOnly; other=xyz"
-        }
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict(
+            {"session": "abc123", "ksi": "test_ksi_value", "other": "xyz"}
+        )
+        mock_response.content = json.dumps({
             "mode": "production",
             "supplier_id": 54321
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -302,7 +375,56 @@ class TestAuthClientEdgeCases:
         
         # Verify ksi cookie was extracted correctly
         assert auth.ksi == "test_ksi_value"
-        mock_session.cookies.set.assert_called_once_with("ksi", "test_ksi_value")
+    
+    @patch('therange.auth.requests.Session')
+    def test_authenticate_ksi_from_session_jar(self, mock_session_class):
+        """Test ksi is read from the session jar when the final response carries no cookie."""
+        # Setup mock response without cookies, e.g. ksi set earlier in a redirect chain
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.cookies = cookiejar_from_dict({})
+        mock_response.content = json.dumps({"mode": "production", "supplier_id": 54321}).encode()
+        mock_response.raise_for_status.return_value = None
+        
+        # Setup mock session whose jar picks up ksi while the login is posted
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
+        
+        def post(*args, **kwargs):
+            mock_session.cookies.set("ksi", "jar_ksi_value")
+            return mock_response
+        mock_session.post.side_effect = post
+        mock_session_class.return_value = mock_session
+        
+        # Test authentication
+        config = Config.production()
+        auth = AuthClient("test_user", "test_pass", config)
+        auth.authenticate()
+        
+        assert auth.ksi == "jar_ksi_value"
+    
+    @patch('therange.auth.requests.Session')
+    def test_authenticate_ksi_from_raw_header(self, mock_session_class):
+        """Test ksi is scanned from the raw Set-Cookie header when the cookie jars rejected it."""
+        # Setup mock response whose ksi cookie did not make it into a jar
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.cookies = cookiejar_from_dict({})
+        mock_response.headers = {"Set-Cookie": 'dksi=decoy; Path=/, ksi="header_ksi_value"; Domain=other.example; HttpOnly'}
+        mock_response.content = json.dumps({"mode": "production", "supplier_id": 54321}).encode()
+        mock_response.raise_for_status.return_value = None
+        
+        # Setup mock session
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        # Test authentication
+        config = Config.production()
+        auth = AuthClient("test_user", "test_pass", config)
+        auth.authenticate()
+        
+        assert auth.ksi == "header_ksi_value"
+        assert mock_session.cookies.get("ksi") == "header_ksi_value"
     
     @patch('therange.auth.requests.Session')
     def test_authenticate_empty_response_json(self, mock_session_class):
@@ -310,14 +432,13 @@ class TestAuthClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=test_ksi_value; Path=/"}
-        mock_response.json.return_value = {}
+        mock_response.cookies = cookiejar_from_dict({"ksi": "test_ksi_value"})
+        mock_response.content = json.dumps({}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test authentication
@@ -353,17 +474,16 @@ class TestAuthClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Set-Cookie": "ksi=new_ksi_value; Path=/"}
-        mock_response.json.return_value = {
+        mock_response.cookies = cookiejar_from_dict({"ksi": "new_ksi_value"})
+        mock_response.content = json.dumps({
             "mode": "updated_mode",
             "supplier_id": 99999
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
-        mock_session = Mock()
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
         mock_session.post.return_value = mock_response
-        mock_session.cookies.set = Mock()
         mock_session_class.return_value = mock_session
         
         # Test multiple authentication calls
@@ -376,11 +496,138 @@ class TestAuthClientEdgeCases:
         assert auth.mode == "updated_mode"
         assert auth.supplier_id == "99999"
         
-        # Second authentication should update state
+        # Second authentication is served from the login cache
         result2 = auth.authenticate()
         assert auth.ksi == "new_ksi_value"
         assert auth.mode == "updated_mode"
         assert auth.supplier_id == "99999"
+        assert result2 == result1
+        assert mock_session.post.call_count == 1
         
-        # Should have called post twice
-        assert mock_session.post.call_count == 2
\ No newline at end of file
+        # A forced authentication should log in again
+        auth.authenticate(force=True)
+        assert auth.ksi == "new_ksi_value"
+        assert mock_session.post.call_count == 2
+
+class TestAuthClientLoginCache:
+    """Test reuse of cached logins across AuthClient instances."""
+    
+    def _login_session(self, ksi="cached_ksi"):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.cookies = cookiejar_from_dict({"ksi": ksi})
+        mock_response.content = json.dumps({"mode": "test_mode", "supplier_id": 12345}).encode()
+        mock_response.raise_for_status.return_value = None
+        
+        mock_session = Mock(cookies=cookiejar_from_dict({}))
+        mock_session.post.return_value = mock_response
+        return mock_session
+    
+    def test_second_client_reuses_login(self):
+        """Test a new client with the same credentials restores state without a POST."""
+        first_session = self._login_session()
+        AuthClient("test_user", "test_pass", Config.uat(), session=first_session).authenticate()
+        
+        second_session = self._login_session()
+        auth = AuthClient("test_user", "test_pass", Config.uat(), session=second_session)
+        result = auth.authenticate()
+        
+        second_session.post.assert_not_called()
+        assert result == {"mode": "test_mode", "supplier_id": 12345}
+        assert auth.ksi == "cached_ksi"
+        assert auth.mode == "test_mode"
+        assert auth.supplier_id == "12345"
+        assert second_session.cookies.get("ksi") == "cached_ksi"
+    
+    def test_cache_is_keyed_by_password_and_environment(self):
+        """Test a different password or base URL always logs in again."""
+        AuthClient("test_user", "test_pass", Config.uat(), session=self._login_session()).authenticate()
+        
+        wrong_password = self._login_session()
+        AuthClient("test_user", "other_pass", Config.uat(), session=wrong_password).authenticate()
+        other_env = self._login_session()
+        AuthClient("test_user", "test_pass", Config.production(), session=other_env).authenticate()
+        
+        wrong_password.post.assert_called_once()
+        other_env.post.assert_called_once()
+    
+    def test_expired_login_is_not_reused(self):
+        """Test entries older than AUTH_CACHE_TTL trigger a real login."""
+        AuthClient("test_user", "test_pass", Config.uat(), session=self._login_session()).authenticate()
+        
+        second_session = self._login_session()
+        with patch('therange.auth.AUTH_CACHE_TTL', 0):
+            AuthClient("test_user", "test_pass", Config.uat(), session=second_session).authenticate()
+        
+        second_session.post.assert_called_once()
+
+
+class _FakeApiAdapter(requests.adapters.BaseAdapter):
+    """Transport that logs in with a new ksi each time and only accepts the latest one."""
+    
+    def __init__(self):
+        super().__init__()
+        self.logins = 0
+        self.cookie_headers = []
+    
+    def send(self, request, **kwargs):
+        if request.url.endswith("authenticate.api"):
+            self.logins += 1
+            self.ksi = f"K{self.logins}"
+            return self._response(request, 200, {"mode": "test", "supplier_id": 1}, f"ksi={self.ksi}; Path=/rest")
+        self.cookie_headers.append(request.headers.get("Cookie"))
+        if request.headers.get("Cookie") != f"ksi={self.ksi}":
+            return self._response(request, 401, {})
+        return self._response(request, 200, {"ok": True})
+    
+    def _response(self, request, status, body, set_cookie=None):
+        msg = HTTPMessage()
+        if set_cookie:
+            msg["Set-Cookie"] = set_cookie
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(body).encode()
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=msg))
+        requests.cookies.extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+    
+    def close(self):
+        pass
+
+
+class TestAuthClientKsiCookie:
+    """Test the ksi cookie against a real session and cookie jar."""
+    
+    def _client(self, adapter):
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return AuthClient("test_user", "test_pass", Config.uat(), session=session)
+    
+    def test_cached_ksi_is_scoped_to_api_host(self):
+        """Test a cache hit sets ksi for the API host only."""
+        adapter = _FakeApiAdapter()
+        self._client(adapter).authenticate()
+        
+        auth = self._client(adapter)
+        auth.authenticate()
+        
+        assert [(c.domain, c.value) for c in auth.session.cookies if c.name == "ksi"] == [
+            ("uatsupplier.rstore.com", "K1")
+        ]
+    
+    def test_retry_after_cache_hit_sends_only_fresh_ksi(self):
+        """Test a 401 after a cached login re-logs in and replays with the new ksi alone."""
+        adapter = _FakeApiAdapter()
+        self._client(adapter).authenticate()
+        auth = self._client(adapter)
+        auth.authenticate()
+        # The server has since expired K1
+        adapter.logins, adapter.ksi = 1, "K-expired"
+        
+        result = BaseClient(auth)._post("order_ack.api", {"order_arr": ["ORDER1"]})
+        
+        assert result == {"ok": True}
+        assert adapter.cookie_headers == ["ksi=K1", "ksi=K2"]
+        assert auth.session.cookies.get("ksi") == "K2"
@@ -5,8 +5,9 @@ Tests base client functionality including initialization and _post method
 with various scenarios using mocked HTTP requests.
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from therange.base_client import BaseClient
 
 
@@ -43,7 +44,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success", "data": "test"}
+        mock_response.content = json.dumps({"status": "success", "data": "test"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -56,11 +57,58 @@ class TestBaseClientPost:
         
         # Verify URL construction
         expected_url = "https://api.test.com/test/endpoint?supplier_id=12345"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value", "mode": "test_mode"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value", "mode": "test_mode"}
         
         # Verify return value
         assert result == {"status": "success", "data": "test"}
-        mock_response.raise_for_status.assert_called_once()
+        # Successful responses skip raise_for_status() entirely
+        mock_response.raise_for_status.assert_not_called()
+    
+    def test_post_url_follows_supplier_id_change(self):
+        """Test cached endpoint URLs are rebuilt when the supplier_id changes."""
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = None
+        mock_auth.base_url = "https://api.test.com/"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_auth.session.post.return_value = mock_response
+        
+        client = BaseClient(mock_auth)
+        client._post("test/endpoint", {})
+        mock_auth.supplier_id = "67890"
+        client._post("test/endpoint", {})
+        
+        urls = [call.args[0] for call in mock_auth.session.post.call_args_list]
+        assert urls == [
+            "https://api.test.com/test/endpoint?supplier_id=12345",
+            "https://api.test.com/test/endpoint?supplier_id=67890",
+        ]
+    
+    def test_post_follows_login_and_session_changes(self):
+        """Test each call uses the current mode and session.post, including a replaced post."""
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = "test_mode"
+        mock_auth.base_url = "https://api.test.com/"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_auth.session.post.return_value = mock_response
+        
+        client = BaseClient(mock_auth)
+        client._post("test/endpoint", {})
+        mock_auth.mode = None
+        client._post("test/endpoint", {})
+        bodies = [json.loads(call.kwargs['data']) for call in mock_auth.session.post.call_args_list]
+        assert bodies == [{"mode": "test_mode"}, {}]
+        
+        wrapped = Mock(return_value=mock_response)
+        mock_auth.session.post = wrapped
+        client._post("test/endpoint", {})
+        wrapped.assert_called_once()
     
     def test_post_success_without_supplier_id(self):
         """Test successful _post call with include_supplier_id=False."""
@@ -73,7 +121,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -86,7 +134,8 @@ class TestBaseClientPost:
         
         # Verify URL construction without supplier_id
         expected_url = "https://api.test.com/test/endpoint"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value", "mode": "test_mode"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value", "mode": "test_mode"}
         
         assert result == {"status": "success"}
     
@@ -101,7 +150,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -114,7 +163,8 @@ class TestBaseClientPost:
         
         # Verify URL construction and payload without mode
         expected_url = "https://api.test.com/test/endpoint?supplier_id=12345"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value"}
         
         assert result == {"status": "success"}
     
@@ -129,7 +179,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -142,7 +192,8 @@ class TestBaseClientPost:
         
         # Verify URL construction and payload without parameters
         expected_url = "https://api.test.com/test/endpoint"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value"}
         
         assert result == {"status": "success"}
     
@@ -157,7 +208,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -170,7 +221,8 @@ class TestBaseClientPost:
         
         # Verify URL construction without supplier_id when it's None
         expected_url = "https://api.test.com/test/endpoint"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value", "mode": "test_mode"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value", "mode": "test_mode"}
         
         assert result == {"status": "success"}
     
@@ -185,7 +237,7 @@ class TestBaseClientPost:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -198,10 +250,52 @@ class TestBaseClientPost:
         
         # Verify URL construction and payload without mode when it's None
         expected_url = "https://api.test.com/test/endpoint?supplier_id=12345"
-        mock_auth.session.post.assert_called_once_with(expected_url, json={"test_key": "test_value"})
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value"}
+        
+        assert result == {"status": "success"}
+    
+    def test_post_with_pre_serialized_bytes(self):
+        """Test _post sends a bytes payload as the raw JSON body."""
+        # Setup mock auth client
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = "test_mode"
+        mock_auth.base_url = "https://api.test.com/"
+        
+        # Setup mock response
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"status": "success"}).encode()
+        mock_response.raise_for_status.return_value = None
+        
+        # Setup mock session
+        mock_auth.session.post.return_value = mock_response
+        
+        # Test _post method
+        client = BaseClient(mock_auth)
+        result = client._post("test/endpoint", b'[{"code":"A","qty":1}]', include_mode=False)
+        
+        # Verify the body is passed through untouched with a JSON content type
+        expected_url = "https://api.test.com/test/endpoint?supplier_id=12345"
+        mock_auth.session.post.assert_called_once_with(
+            expected_url, data=b'[{"code":"A","qty":1}]', headers={"Content-Type": "application/json"}
+        )
         
         assert result == {"status": "success"}
 
+    
+    def test_post_bytes_payload_with_mode_rejected(self):
+        """Test a bytes payload cannot have mode merged in and is not sent."""
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = "test_mode"
+        mock_auth.base_url = "https://api.test.com/"
+        
+        client = BaseClient(mock_auth)
+        with pytest.raises(ValueError, match="Cannot add mode to a pre-serialized payload"):
+            client._post("test/endpoint", b'[{"code":"A","qty":1}]')
+        mock_auth.session.post.assert_not_called()
 
 class TestBaseClientPostErrors:
     """Test BaseClient _post method error scenarios."""
@@ -228,6 +322,37 @@ class TestBaseClientPostErrors:
         with pytest.raises(PermissionError, match="Not authenticated."):
             client._post("test/endpoint", payload)
     
+    def test_post_401_reauthenticates_and_retries_once(self):
+        """Test a 401 triggers a forced re-login and a single replay of the request."""
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = None
+        mock_auth.base_url = "https://api.test.com/"
+        expired = Mock(status_code=401)
+        ok = Mock(status_code=200, content=b'{"status": "success"}')
+        mock_auth.session.post.side_effect = [expired, ok]
+        
+        client = BaseClient(mock_auth)
+        result = client._post("test/endpoint", {"test_key": "test_value"})
+        
+        assert result == {"status": "success"}
+        mock_auth.authenticate.assert_called_once_with(force=True)
+        assert mock_auth.session.post.call_count == 2
+    
+    def test_post_401_after_failed_relogin_raises_original_error(self):
+        """Test a rejected re-login surfaces the original 401 without a replay."""
+        mock_auth = Mock()
+        mock_auth.supplier_id = "12345"
+        mock_auth.mode = None
+        mock_auth.base_url = "https://api.test.com/"
+        mock_auth.session.post.return_value = Mock(status_code=401)
+        mock_auth.authenticate.side_effect = PermissionError("Unauthorized: Invalid credentials")
+        
+        client = BaseClient(mock_auth)
+        with pytest.raises(PermissionError, match="Not authenticated."):
+            client._post("test/endpoint", {"test_key": "test_value"})
+        assert mock_auth.session.post.call_count == 1
+    
     def test_post_400_bad_request(self):
         """Test _post with 400 bad request error."""
         # Setup mock auth client
@@ -289,7 +414,7 @@ class TestBaseClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success", "id": 123}
+        mock_response.content = json.dumps({"status": "success", "id": 123}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -317,7 +442,8 @@ class TestBaseClientEdgeCases:
         }
         
         expected_url = "https://api.test.com/complex/endpoint?supplier_id=12345"
-        mock_auth.session.post.assert_called_once_with(expected_url, json=expected_payload)
+        mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == expected_payload
         
         assert result == {"status": "success", "id": 123}
     
@@ -332,7 +458,7 @@ class TestBaseClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -345,9 +471,9 @@ class TestBaseClientEdgeCases:
         
         client._post("test/endpoint", original_payload)
         
-        # Verify original payload was modified by adding mode
-        assert original_payload == {"test_key": "test_value", "mode": "test_mode"}
-        assert original_payload != original_payload_copy
+        # Verify mode was added to the request body but not to the caller's payload
+        assert original_payload == original_payload_copy
+        assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test_key": "test_value", "mode": "test_mode"}
     
     def test_post_endpoint_url_construction(self):
         """Test various endpoint URL constructions."""
@@ -360,7 +486,7 @@ class TestBaseClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_response.raise_for_status.return_value = None
         
         # Setup mock session
@@ -380,4 +506,5 @@ class TestBaseClientEdgeCases:
         for endpoint, expected_url in test_cases:
             mock_auth.session.post.reset_mock()
             client._post(endpoint, payload.copy())
-            mock_auth.session.post.assert_called_once_with(expected_url, json={"test": "data", "mode": "test_mode"})
\ No newline at end of file
+            mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+            assert json.loads(mock_auth.session.post.call_args.kwargs['data']) == {"test": "data", "mode": "test_mode"}
\ No newline at end of file
@@ -5,6 +5,8 @@ Tests configuration classes including environment management,
 URL construction, and integration with AuthClient and TheRangeManager.
 """
 
+import copy
+import pickle
 import pytest
 from therange.config import Config, EnvironmentConfig
 from therange.auth import AuthClient
@@ -78,6 +80,41 @@ class TestConfig:
         assert config.base_url == "https://uatsupplier.rstore.com/rest/"
         assert config.is_test_environment
     
+    def test_pool_maxsize(self):
+        """Test pool_maxsize defaults to 32 and can be set per configuration."""
+        assert Config().pool_maxsize == 32
+        assert Config.production().pool_maxsize == 32
+        assert Config(Config.UAT, pool_maxsize=64).pool_maxsize == 64
+        assert Config.custom("https://custom.api.com/rest", pool_maxsize=8).pool_maxsize == 8
+    
+    def test_factory_configs_are_shared(self):
+        """Test production(), uat() and custom() return one cached instance per set of arguments."""
+        assert Config.production() is Config.production()
+        assert Config.uat() is Config.uat()
+        assert Config.production() is not Config.uat()
+        assert Config.custom("https://a.example.com") is Config.custom("https://a.example.com")
+        assert Config.custom("https://a.example.com") is not Config.custom("https://b.example.com")
+    
+    def test_configs_are_immutable(self):
+        """Test shared configurations cannot be modified in place."""
+        with pytest.raises(AttributeError):
+            Config.production().pool_maxsize = 1
+        with pytest.raises(AttributeError):
+            Config.UAT.base_url = "https://elsewhere.example.com/"
+    
+    def test_configs_copy_and_pickle(self):
+        """Test immutable configurations survive copy, deepcopy and a pickle round trip."""
+        config = Config.custom("https://custom.api.com/rest", "custom", pool_maxsize=8)
+        
+        assert copy.copy(config) is config
+        assert copy.deepcopy({"config": config})["config"] is config
+        restored = pickle.loads(pickle.dumps(config))
+        assert (restored.base_url, restored.environment.name, restored.pool_maxsize) == (
+            "https://custom.api.com/rest/", "custom", 8
+        )
+        with pytest.raises(AttributeError):
+            restored.pool_maxsize = 1
+    
     def test_custom_class_method(self):
         """Test custom() class method."""
         custom_url = "https://custom.api.com/v1/rest"
@@ -4,11 +4,13 @@ Unit tests for the OrderAck module.
 Tests order acknowledgment functionality including request validation and client behavior.
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from pydantic import ValidationError
 from therange.order_ack import OrderAckRequest, OrderAckClient
 from therange.auth import AuthClient
+from therange.config import Config
 
 
 class TestOrderAckRequest:
@@ -55,7 +57,7 @@ class TestOrderAckClient:
     
     def setup_method(self):
         """Setup method called before each test."""
-        self.mock_auth = Mock(spec=AuthClient)
+        self.mock_auth = AuthClient("test_user", "test_pass", Config.uat())
         self.mock_auth.session = Mock()
         self.mock_auth.supplier_id = "12345"
         self.mock_auth.mode = "test"
@@ -131,6 +133,45 @@ class TestOrderAckClient:
         
         with pytest.raises(ValueError, match="Bad request: Invalid order format"):
             self.client.acknowledge_orders(["ORDER123"])
+    
+    @patch('therange.order_ack.OrderAckClient._post')
+    def test_acknowledge_orders_bulk_chunks_requests(self, mock_post):
+        """Test that bulk acknowledgement posts one request per chunk, in order."""
+        mock_post.side_effect = lambda endpoint, payload: {"acked": payload["order_arr"]}
+        order_numbers = [f"ORDER{i}" for i in range(5)]
+        
+        result = self.client.acknowledge_orders_bulk(order_numbers, chunk_size=2)
+        
+        assert mock_post.call_count == 3
+        assert [r["acked"] for r in result] == [["ORDER0", "ORDER1"], ["ORDER2", "ORDER3"], ["ORDER4"]]
+        assert all(call.args[0] == "order_ack.api" for call in mock_post.call_args_list)
+    
+    @patch('therange.order_ack.OrderAckClient._post')
+    def test_acknowledge_orders_bulk_returns_failures_in_place(self, mock_post):
+        """Test that a failed chunk is returned in place without losing the other responses."""
+        def post(endpoint, payload):
+            if payload["order_arr"] == ["ORDER2", "ORDER3"]:
+                raise ValueError("Bad request: Invalid order format")
+            return {"acked": payload["order_arr"]}
+        mock_post.side_effect = post
+        
+        result = self.client.acknowledge_orders_bulk([f"ORDER{i}" for i in range(5)], chunk_size=2)
+        
+        assert result[0] == {"acked": ["ORDER0", "ORDER1"]}
+        assert isinstance(result[1], ValueError)
+        assert result[2] == {"acked": ["ORDER4"]}
+    
+    @patch('therange.order_ack.OrderAckClient._post')
+    def test_acknowledge_orders_bulk_validates_before_sending(self, mock_post):
+        """Test that an invalid order number anywhere in the list prevents every request."""
+        with pytest.raises(ValueError, match="Invalid order_numbers"):
+            self.client.acknowledge_orders_bulk(["ORDER1", "", "ORDER3"], chunk_size=1)
+        mock_post.assert_not_called()
+    
+    def test_acknowledge_orders_bulk_invalid_chunk_size_raises_error(self):
+        """Test that a chunk_size below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            self.client.acknowledge_orders_bulk(["ORDER1"], chunk_size=0)
 
 
 class TestOrderAckClientIntegration:
@@ -138,7 +179,7 @@ class TestOrderAckClientIntegration:
     
     def setup_method(self):
         """Setup method called before each test."""
-        self.mock_auth = Mock(spec=AuthClient)
+        self.mock_auth = AuthClient("test_user", "test_pass", Config.uat())
         self.mock_auth.session = Mock()
         self.mock_auth.supplier_id = "12345"
         self.mock_auth.mode = "test"
@@ -150,7 +191,7 @@ class TestOrderAckClientIntegration:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"order_arr": ["ORDER123", "ORDER456"]}
+        mock_response.content = json.dumps({"order_arr": ["ORDER123", "ORDER456"]}).encode()
         mock_response.raise_for_status.return_value = None
         self.mock_auth.session.post.return_value = mock_response
         
@@ -161,7 +202,8 @@ class TestOrderAckClientIntegration:
         expected_url = "https://uatsupplier.rstore.com/rest/order_ack.api?supplier_id=12345"
         expected_payload = {"order_arr": ["ORDER123", "ORDER456"], "mode": "test"}
         
-        self.mock_auth.session.post.assert_called_once_with(expected_url, json=expected_payload)
+        self.mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(self.mock_auth.session.post.call_args.kwargs['data']) == expected_payload
         assert result == {"order_arr": ["ORDER123", "ORDER456"]}
     
     def test_api_call_without_mode(self):
@@ -171,7 +213,7 @@ class TestOrderAckClientIntegration:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"order_arr": ["ORDER123"]}
+        mock_response.content = json.dumps({"order_arr": ["ORDER123"]}).encode()
         mock_response.raise_for_status.return_value = None
         self.mock_auth.session.post.return_value = mock_response
         
@@ -182,5 +224,6 @@ class TestOrderAckClientIntegration:
         expected_url = "https://uatsupplier.rstore.com/rest/order_ack.api?supplier_id=12345"
         expected_payload = {"order_arr": ["ORDER123"]}
         
-        self.mock_auth.session.post.assert_called_once_with(expected_url, json=expected_payload)
+        self.mock_auth.session.post.assert_called_once_with(expected_url, data=ANY, headers={"Content-Type": "application/json"})
+        assert json.loads(self.mock_auth.session.post.call_args.kwargs['data']) == expected_payload
         assert result == {"order_arr": ["ORDER123"]}
\ No newline at end of file
@@ -14,6 +14,7 @@ from therange.order_event import (
     OrderEventClient
 )
 from therange.auth import AuthClient
+from therange.config import Config
 
 
 class TestOrderItem:
@@ -35,22 +36,37 @@ class TestOrderItem:
     
     def test_order_item_invalid_qty_zero(self):
         """Test OrderItem with invalid quantity of zero."""
-        with pytest.raises(ValueError, match="Input should be greater than or equal to 1"):
+        with pytest.raises(ValueError, match="qty must be an integer >= 1"):
             OrderItem(code="TEST", qty=0)
     
     def test_order_item_invalid_qty_negative(self):
         """Test OrderItem with negative quantity."""
-        with pytest.raises(ValueError, match="Input should be greater than or equal to 1"):
+        with pytest.raises(ValueError, match="qty must be an integer >= 1"):
             OrderItem(code="TEST", qty=-1)
     
+    def test_order_item_rejects_unknown_fields(self):
+        """Test OrderItem rejects fields the API does not accept."""
+        with pytest.raises(TypeError, match="unexpected keyword argument 'colour'"):
+            OrderItem(code="TEST", qty=1, colour="red")
+    
+    def test_order_item_rejects_non_integer_qty(self):
+        """Test OrderItem does not coerce qty from other types."""
+        with pytest.raises(ValueError, match="qty must be an integer >= 1"):
+            OrderItem(code="TEST", qty="2")
+    
+    def test_order_item_rejects_empty_code(self):
+        """Test OrderItem requires a non-empty code."""
+        with pytest.raises(ValueError, match="code must be a non-empty string"):
+            OrderItem(code="", qty=1)
+    
     def test_order_item_missing_code(self):
         """Test OrderItem without required code field."""
-        with pytest.raises(ValueError, match="Field required"):
+        with pytest.raises(TypeError, match="missing 1 required positional argument: 'code'"):
             OrderItem(qty=1)
     
     def test_order_item_missing_qty(self):
         """Test OrderItem without required qty field."""
-        with pytest.raises(ValueError, match="Field required"):
+        with pytest.raises(TypeError, match="missing 1 required positional argument: 'qty'"):
             OrderItem(code="TEST")
 
 
@@ -109,6 +125,21 @@ class TestDispatchOrderRequest:
                 tracking_reference="TR123456"
             )
     
+    def test_dispatch_request_accepts_order_items_and_rejects_bad_dicts(self):
+        """Test items may mix OrderItem instances and dicts, and malformed dicts fail validation."""
+        kwargs = dict(
+            order_number="ORD003",
+            despatch_date="2023-12-01 10:30:00",
+            delivery_service="Standard",
+            courier_name="DHL",
+            tracking_reference="TR123456"
+        )
+        request = DispatchOrderRequest(items=[OrderItem("A", 1), {"code": "B", "qty": 2}], **kwargs)
+        assert request.items == [OrderItem("A", 1), OrderItem("B", 2)]
+        
+        with pytest.raises(ValueError, match="invalid item"):
+            DispatchOrderRequest(items=[{"code": "A"}], **kwargs)
+    
     def test_dispatch_request_invalid_despatch_date_format(self):
         """Test DispatchOrderRequest with invalid despatch_date format."""
         items = [{"code": "ABC123", "qty": 1}]
@@ -122,6 +153,20 @@ class TestDispatchOrderRequest:
                 tracking_reference="TR123456"
             )
     
+    @pytest.mark.parametrize("despatch_date", ["2023-02-29 10:30:00", "2023-12-01 24:00:00", "2023-12-01 10:30:00\n"])
+    def test_dispatch_request_impossible_despatch_date(self, despatch_date):
+        """Test DispatchOrderRequest rejects well-shaped but impossible dates and trailing text."""
+        items = [{"code": "ABC123", "qty": 1}]
+        with pytest.raises(ValueError, match="despatch_date must be in format YYYY-MM-DD HH:MM:SS"):
+            DispatchOrderRequest(
+                order_number="ORD004",
+                items=items,
+                despatch_date=despatch_date,
+                delivery_service="Standard",
+                courier_name="DHL",
+                tracking_reference="TR123456"
+            )
+    
     def test_dispatch_request_invalid_earliest_delivery_format(self):
         """Test DispatchOrderRequest with invalid earliest_delivery format."""
         items = [{"code": "ABC123", "qty": 1}]
@@ -237,7 +282,7 @@ class TestOrderEventClient:
     
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.mock_auth = Mock(spec=AuthClient)
+        self.mock_auth = AuthClient("test_user", "test_pass", Config.uat())
         self.mock_auth.session = Mock()
         self.mock_auth.supplier_id = "12345"
         self.client = OrderEventClient(self.mock_auth)
@@ -461,7 +506,7 @@ class TestOrderEventClientIntegration:
     
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.mock_auth = Mock(spec=AuthClient)
+        self.mock_auth = AuthClient("test_user", "test_pass", Config.uat())
         self.mock_auth.session = Mock()
         self.mock_auth.supplier_id = "12345"
         self.mock_auth.mode = "test"
@@ -519,4 +564,32 @@ class TestOrderEventClientIntegration:
         
         assert result["event_id"] == "EVT789"
         assert result["processed"] is True
-        mock_post.assert_called_once_with("order_event.api", event_payload)
\ No newline at end of file
+        mock_post.assert_called_once_with("order_event.api", event_payload)
+    
+    @patch('therange.base_client.BaseClient._post')
+    def test_dispatch_orders_returns_results_and_exceptions_in_order(self, mock_post):
+        """Test that dispatch_orders keeps input order and returns failures in place."""
+        mock_post.side_effect = lambda endpoint, payload: {"dispatched": payload["order_number"]}
+        dispatch = {
+            "items": [{"code": "TEST123", "qty": 1}],
+            "despatch_date": "2023-12-15 14:30:00",
+            "delivery_service": "Standard",
+            "courier_name": "Test Courier",
+            "tracking_reference": "TR123",
+        }
+        
+        results = self.client.dispatch_orders([
+            {**dispatch, "order_number": "ORD1"},
+            {**dispatch, "order_number": "ORD2", "despatch_date": "not a date"},
+            {**dispatch, "order_number": "ORD3"},
+        ])
+        
+        assert results[0] == {"dispatched": "ORD1"}
+        assert isinstance(results[1], ValueError)
+        assert "Invalid dispatch request" in str(results[1])
+        assert results[2] == {"dispatched": "ORD3"}
+        assert mock_post.call_count == 2
+    
+    def test_dispatch_orders_empty_list(self):
+        """Test that dispatch_orders with no dispatches sends nothing."""
+        assert self.client.dispatch_orders([]) == []
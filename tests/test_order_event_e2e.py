@@ -24,219 +24,106 @@ Note: These tests make actual API calls to the live UAT environment and will cre
 test data. Use appropriate test credentials and clean up any test data as needed.
 """
 
+import uuid
+import logging
 import pytest
-import os
 import requests
 from datetime import datetime, timedelta
-from therange import TheRangeManager, Config
 from therange.order_event import OrderEventClient
 from therange.auth import AuthClient
 
 
+pytestmark = [pytest.mark.e2e, pytest.mark.serial, pytest.mark.vcr]
+
+
+log = logging.getLogger(__name__)
+
+
 class TestOrderEventClientE2E:
     """End-to-end tests for OrderEventClient with live API."""
     
-    @classmethod
-    def setup_class(cls):
-        """Set up test fixtures before running the test class."""
-        cls.username = os.getenv("THERANGE_USERNAME")
-        cls.password = os.getenv("THERANGE_PASSWORD")
-        cls.skip_reason = "E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-        
-        if cls.username and cls.password:
-            cls.config = Config.uat()
-            cls.manager = TheRangeManager(cls.username, cls.password, cls.config)
-            cls.auth = cls.manager.auth
-            cls.client = cls.manager.order_event
-    
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_network_connectivity_e2e(self):
-        """Test network connectivity to the UAT API."""
-        config = Config.uat()
-        try:
-            response = requests.get(config.base_url, timeout=10)
-            # We don't care about the response content, just that we can reach the server
-            assert True  # If we get here, connectivity is working
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
-    
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_authentication_e2e(self):
+    def test_authentication_e2e(self, manager):
         """Test successful authentication against the live UAT API."""
-        try:
-            # Authenticate with the live API
-            auth_response = self.auth.authenticate()
-            
-            # Verify authentication was successful
-            assert auth_response is not None
-            assert self.auth.session is not None
-            assert self.auth.supplier_id is not None
-            assert self.auth.ksi is not None
-            assert self.auth.mode is not None
-            
-            # Verify we're using the UAT environment
-            assert "uatsupplier.rstore.com" in self.auth.base_url
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
+        # The session-scoped fixture has already authenticated
+        auth = manager.auth
+        
+        # Verify authentication was successful
+        assert auth.session is not None
+        assert auth.supplier_id is not None
+        assert auth.ksi is not None
+        assert auth.mode is not None
+        
+        # Verify we're using the UAT environment
+        assert "uatsupplier.rstore.com" in auth.base_url
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_dispatch_order_e2e(self):
+    def test_dispatch_order_e2e(self, manager, dispatch_factory, assert_api_response):
         """Test dispatch_order method with live API call."""
-        try:
-            # Authenticate first
-            self.auth.authenticate()
-            
-            # Generate unique order number and tracking reference for testing
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            test_order_number = f"E2E_TEST_{timestamp}"
-            tracking_ref = f"TR_E2E_{timestamp}"
-            
-            # Prepare test data
-            items = [{"code": "E2E_TEST_PRODUCT", "qty": 1}]
-            despatch_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
-            earliest_delivery = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
-            latest_delivery = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-            
-            # Make the API call
-            response = self.client.dispatch_order(
-                order_number=test_order_number,
-                items=items,
-                despatch_date=despatch_date,
-                delivery_service="Standard",
-                courier_name="E2E Test Courier",
-                tracking_reference=tracking_ref,
-                earliest_delivery=earliest_delivery,
-                latest_delivery=latest_delivery
-            )
-            
-            # Verify response structure (actual response may vary based on API implementation)
-            assert response is not None
-            assert isinstance(response, dict)
-            
-            # Log response for debugging
-            print(f"Dispatch order response: {response}")
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
+        # Prepare a unique order including the optional delivery window
+        dispatch = dispatch_factory(
+            earliest_delivery=(datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d"),
+            latest_delivery=(datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
+        )
+        
+        # Make the API call
+        response = manager.order_event.dispatch_order(**dispatch)
+        
+        assert_api_response(response, "Dispatch order response")
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_cancel_order_e2e(self):
+    def test_cancel_order_e2e(self, manager, assert_api_response):
         """Test cancel_order method with live API call."""
-        try:
-            # Authenticate first
-            self.auth.authenticate()
-            
-            # Generate unique order number for testing
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            test_order_number = f"E2E_CANCEL_TEST_{timestamp}"
-            
-            # Prepare test data
-            items = [{"code": "E2E_CANCEL_PRODUCT", "qty": 2}]
-            
-            # Make the API call
-            response = self.client.cancel_order(
-                order_number=test_order_number,
-                items=items,
-                cancel_code="Stock not available",
-                cancel_reason="E2E test cancellation"
-            )
-            
-            # Verify response structure (actual response may vary based on API implementation)
-            assert response is not None
-            assert isinstance(response, dict)
-            
-            # Log response for debugging
-            print(f"Cancel order response: {response}")
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
+        # Generate unique order number for testing
+        test_order_number = f"E2E_CANCEL_TEST_{uuid.uuid4().hex[:8]}"
+        
+        # Prepare test data
+        items = [{"code": "E2E_CANCEL_PRODUCT", "qty": 2}]
+        
+        # Make the API call
+        response = manager.order_event.cancel_order(
+            order_number=test_order_number,
+            items=items,
+            cancel_code="Stock not available",
+            cancel_reason="E2E test cancellation"
+        )
+        
+        assert_api_response(response, "Cancel order response")
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_send_event_e2e(self):
+    def test_send_event_e2e(self, manager, assert_api_response):
         """Test send_event method with live API call."""
-        try:
-            # Authenticate first
-            self.auth.authenticate()
-            
-            # Generate unique test data
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            
-            # Prepare test event payload
-            event_payload = {
-                "type": "e2e_test_event",
-                "order_number": f"E2E_EVENT_TEST_{timestamp}",
-                "timestamp": timestamp,
-                "test_data": "End-to-end test event data"
-            }
-            
-            # Make the API call
-            response = self.client.send_event(event_payload)
-            
-            # Verify response structure (actual response may vary based on API implementation)
-            assert response is not None
-            assert isinstance(response, dict)
-            
-            # Log response for debugging
-            print(f"Send event response: {response}")
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
+        # Generate unique test data
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        
+        # Prepare test event payload
+        event_payload = {
+            "type": "e2e_test_event",
+            "order_number": f"E2E_EVENT_TEST_{uuid.uuid4().hex[:8]}",
+            "timestamp": timestamp,
+            "test_data": "End-to-end test event data"
+        }
+        
+        # Make the API call
+        response = manager.order_event.send_event(event_payload)
+        
+        assert_api_response(response, "Send event response")
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_authentication_error_handling_e2e(self):
+    def test_authentication_error_handling_e2e(self, manager, uat_config):
         """Test authentication error handling with invalid credentials."""
+        # Reuse the warm connection pool, but keep a separate cookie jar so the
+        # failed login cannot disturb the shared authenticated session
+        session = requests.Session()
+        session.mount("https://", manager.auth.session.get_adapter(manager.auth.base_url))
+        
         # Create auth client with invalid credentials
-        config = Config.uat()
-        invalid_auth = AuthClient("invalid_user", "invalid_pass", config)
+        invalid_auth = AuthClient("invalid_user", "invalid_pass", uat_config, session=session)
         
-        # Attempt authentication and expect it to fail
-        try:
-            with pytest.raises(PermissionError, match="Unauthorized: Invalid credentials"):
-                invalid_auth.authenticate()
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except Exception as e:
-            # If we get any other exception, re-raise it as it might be what we're testing for
-            if "Unauthorized" in str(e) or "401" in str(e):
-                # This is expected - authentication failed as intended
-                pass
-            else:
-                raise
+        # Attempt authentication and expect it to fail; UAT answers 401, which
+        # surfaces as PermissionError, or an HTTPError for other rejections
+        with pytest.raises((PermissionError, requests.HTTPError)):
+            invalid_auth.authenticate()
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_unauthenticated_api_call_e2e(self):
+    def test_unauthenticated_api_call_e2e(self, uat_config):
         """Test that API calls fail without authentication."""
-        # Create client without authentication
-        config = Config.uat()
-        auth = AuthClient(self.username, self.password, config)
+        # Create client without authentication; constructing it performs no network I/O
+        auth = AuthClient("unauthenticated_user", "unused_password", uat_config)
         client = OrderEventClient(auth)
         
         # Attempt API call without authentication
@@ -255,53 +142,30 @@ class TestOrderEventClientE2E:
 class TestOrderEventE2EIntegration:
     """Integration scenarios for e2e order event testing."""
     
-    @pytest.mark.skipif(
-        not (os.getenv("THERANGE_USERNAME") and os.getenv("THERANGE_PASSWORD")),
-        reason="E2E tests require THERANGE_USERNAME and THERANGE_PASSWORD environment variables"
-    )
-    def test_full_order_lifecycle_e2e(self):
+    def test_full_order_lifecycle_e2e(self, manager, dispatch_factory):
         """Test complete order lifecycle: dispatch then cancel."""
-        try:
-            username = os.getenv("THERANGE_USERNAME")
-            password = os.getenv("THERANGE_PASSWORD")
-            
-            # Set up manager and authenticate
-            config = Config.uat()
-            manager = TheRangeManager(username, password, config)
-            manager.authenticate()
-            
-            # Generate unique test data
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            test_order_number = f"E2E_LIFECYCLE_{timestamp}"
-            items = [{"code": "LIFECYCLE_PRODUCT", "qty": 1}]
-            
-            # First, dispatch the order
-            despatch_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
-            dispatch_response = manager.order_event.dispatch_order(
-                order_number=test_order_number,
-                items=items,
-                despatch_date=despatch_date,
-                delivery_service="Express",
-                courier_name="Lifecycle Test Courier",
-                tracking_reference=f"LC_{timestamp}"
-            )
-            
-            # Verify dispatch response
-            assert dispatch_response is not None
-            print(f"Dispatch response: {dispatch_response}")
-            
-            # Then, cancel the same order
-            cancel_response = manager.order_event.cancel_order(
-                order_number=test_order_number,
-                items=items,
-                cancel_code="Unable to deliver to address",
-                cancel_reason="E2E lifecycle test - order cancelled after dispatch"
-            )
-            
-            # Verify cancel response
-            assert cancel_response is not None
-            print(f"Cancel response: {cancel_response}")
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Network connectivity issue - cannot reach UAT API")
-        except requests.exceptions.Timeout:
-            pytest.skip("Network timeout - UAT API is not responding")
\ No newline at end of file
+        # Generate unique test data
+        dispatch = dispatch_factory(
+            items=[{"code": "LIFECYCLE_PRODUCT", "qty": 1}],
+            delivery_service="Express",
+            courier_name="Lifecycle Test Courier"
+        )
+        
+        # First, dispatch the order
+        dispatch_response = manager.order_event.dispatch_order(**dispatch)
+        
+        # Verify dispatch response
+        assert dispatch_response is not None
+        log.debug("Dispatch response: %s", dispatch_response)
+        
+        # Then, cancel the same order
+        cancel_response = manager.order_event.cancel_order(
+            order_number=dispatch["order_number"],
+            items=dispatch["items"],
+            cancel_code="Unable to deliver to address",
+            cancel_reason="E2E lifecycle test - order cancelled after dispatch"
+        )
+        
+        # Verify cancel response
+        assert cancel_response is not None
+        log.debug("Cancel response: %s", cancel_response)
@@ -5,11 +5,15 @@ Tests order feed functionality including request validation,
 client methods, and various error scenarios using mocked HTTP requests.
 """
 
+import io
+import json
 import pytest
 from unittest.mock import Mock, patch
+from requests.cookies import cookiejar_from_dict
 from datetime import datetime, timedelta
 from therange.order_feed import OrderFeedRequest, OrderFeedClient
 from therange.auth import AuthClient
+from therange.config import Config
 
 
 class TestOrderFeedRequest:
@@ -73,7 +77,7 @@ class TestOrderFeedRequest:
     
     def test_type_validation_invalid_value(self):
         """Test that invalid type values raise ValidationError."""
-        with pytest.raises(ValueError, match="type must be one of"):
+        with pytest.raises(ValueError, match="Input should be 'all', 'new', 'pending' or 'historic'"):
             OrderFeedRequest(type="invalid_type")
     
     def test_date_range_validation_valid_range(self):
@@ -94,6 +98,11 @@ class TestOrderFeedRequest:
         with pytest.raises(ValueError, match="Date range cannot exceed 35 days"):
             OrderFeedRequest(**{"from": from_date, "to": to_date})
     
+    def test_date_range_validation_unpadded_fields(self):
+        """Test the range check parses the unpadded fields strptime accepted too."""
+        with pytest.raises(ValueError, match="Date range cannot exceed 35 days"):
+            OrderFeedRequest(**{"from": "2025-6-1 0:0:0", "to": "2025-7-7 0:0:0"})
+    
     def test_date_range_validation_no_from_date(self):
         """Test that validation passes when only to_date is provided."""
         request = OrderFeedRequest(**{"to": "2025-06-15 23:59:59"})
@@ -128,8 +137,8 @@ class TestOrderFeedClient:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_auth = Mock(spec=AuthClient)
-        self.mock_auth.session = Mock()
+        self.mock_auth = AuthClient("test_user", "test_pass", Config.uat())
+        self.mock_auth.session = Mock(cookies=cookiejar_from_dict({}))
         self.mock_auth.supplier_id = "12345"
         self.mock_auth.base_url = "https://test.api.com/rest/"
         self.mock_auth.mode = "test_mode"
@@ -141,12 +150,12 @@ class TestOrderFeedClient:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "order_arr": [
                 {"order_number": "W000001", "status": "new"},
                 {"order_number": "W000002", "status": "pending"}
             ]
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         self.mock_auth.session.post.return_value = mock_response
         
@@ -174,7 +183,7 @@ class TestOrderFeedClient:
             "to": "2025-06-15 23:59:59",
             "mode": "test_mode"
         }
-        actual_payload = call_args[1]['json'] if 'json' in call_args[1] else call_args[1]['data']
+        actual_payload = json.loads(call_args[1]['data'])
         assert actual_payload == expected_payload
         
         # Verify response
@@ -188,7 +197,7 @@ class TestOrderFeedClient:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"order_arr": []}
+        mock_response.content = json.dumps({"order_arr": []}).encode()
         mock_response.raise_for_status.return_value = None
         self.mock_auth.session.post.return_value = mock_response
         
@@ -204,11 +213,65 @@ class TestOrderFeedClient:
             "type": "all",
             "mode": "test_mode"
         }
-        actual_payload = call_args[1]['json'] if 'json' in call_args[1] else call_args[1]['data']
+        actual_payload = json.loads(call_args[1]['data'])
         assert actual_payload == expected_payload
         
         assert result == {"order_arr": []}
     
+    def test_iter_orders_yields_each_order_and_closes_response(self):
+        """Test iter_orders streams the feed request and yields orders one by one."""
+        orders = [{"order_number": "W000001"}, {"order_number": "W000002"}]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"order_arr": orders}).encode()
+        mock_response.raw = io.BytesIO(mock_response.content)
+        self.mock_auth.session.post.return_value = mock_response
+        
+        result = list(self.client.iter_orders(type="new"))
+        
+        assert result == orders
+        call_args = self.mock_auth.session.post.call_args
+        assert call_args.args[0] == "https://test.api.com/rest/order_feed.api?supplier_id=12345"
+        assert call_args.kwargs['stream'] is True
+        assert json.loads(call_args.kwargs['data']) == {"type": "new", "mode": "test_mode"}
+        mock_response.close.assert_called_once()
+    
+    def test_iter_orders_validates_before_iteration(self):
+        """Test iter_orders raises for invalid filters when called, before any request."""
+        with pytest.raises(ValueError, match="Invalid parameters"):
+            self.client.iter_orders(type="invalid")
+        self.mock_auth.session.post.assert_not_called()
+    
+    def test_iter_orders_401_raises_permission_error(self):
+        """Test iter_orders maps a 401 response to PermissionError."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        self.mock_auth.session.post.return_value = mock_response
+        
+        with pytest.raises(PermissionError, match="Not authenticated."):
+            list(self.client.iter_orders())
+        mock_response.close.assert_called_once()
+    
+    def test_iter_orders_401_reauthenticates_and_replays_once(self):
+        """Test an expired login on iter_orders is refreshed and the stream request replayed with it."""
+        expired = Mock(status_code=401)
+        fresh = Mock(status_code=200, content=json.dumps({"order_arr": [{"order_number": "W000001"}]}).encode())
+        fresh.raw = io.BytesIO(fresh.content)
+        self.mock_auth.session.post.side_effect = [expired, fresh]
+        
+        def relogin(force=False):
+            self.mock_auth.mode = "fresh_mode"
+        
+        with patch.object(self.mock_auth, "authenticate", side_effect=relogin) as authenticate:
+            result = list(self.client.iter_orders())
+        
+        assert result == [{"order_number": "W000001"}]
+        authenticate.assert_called_once_with(force=True)
+        bodies = [json.loads(call.kwargs['data']) for call in self.mock_auth.session.post.call_args_list]
+        assert bodies == [{"type": "all", "mode": "test_mode"}, {"type": "all", "mode": "fresh_mode"}]
+        expired.close.assert_called_once()
+        fresh.close.assert_called_once()
+    
     def test_get_orders_authentication_no_session(self):
         """Test that authentication is validated - no session."""
         self.mock_auth.session = None
@@ -277,7 +340,7 @@ class TestOrderFeedClient:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"order_arr": []}
+        mock_response.content = json.dumps({"order_arr": []}).encode()
         mock_response.raise_for_status.return_value = None
         self.mock_auth.session.post.return_value = mock_response
         
@@ -291,7 +354,7 @@ class TestOrderFeedClient:
         
         # Verify that None values are excluded
         call_args = self.mock_auth.session.post.call_args
-        actual_payload = call_args[1]['json'] if 'json' in call_args[1] else call_args[1]['data']
+        actual_payload = json.loads(call_args[1]['data'])
         
         expected_payload = {
             "search": "test_search",
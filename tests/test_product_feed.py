@@ -5,9 +5,10 @@ Tests product feed functionality including Pydantic model validation,
 client methods, authentication checks, and various error scenarios.
 """
 
+import json
 import pytest
 from datetime import date
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from pydantic import ValidationError
 
 from therange.product_feed import (
@@ -20,6 +21,7 @@ from therange.product_feed import (
     ProductFeedClient
 )
 from therange.auth import AuthClient
+from therange.config import Config
 
 
 class TestPydanticModels:
@@ -54,6 +56,11 @@ class TestPydanticModels:
                 effective_from=date(2025, 1, 1)
             )
     
+    def test_price_entry_rejects_unknown_field(self):
+        """Test misspelt or unknown fields are rejected rather than dropped."""
+        with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+            PriceEntry(price=19.95, effective_from=date(2025, 6, 15), curency="EUR")
+    
     def test_product_attribute_valid(self):
         """Test valid ProductAttribute creation."""
         attr = ProductAttribute(
@@ -170,6 +177,59 @@ class TestPydanticModels:
                 fulfilment_class="Small"
             )
     
+    def test_product_entry_urls_kept_verbatim(self):
+        """Test image URLs are checked for an http(s) scheme and kept as the strings given."""
+        product = ProductEntry(
+            vendor_sku="TEST123",
+            title="Test Product",
+            brand="Test Brand",
+            price_arr=[PriceEntry(price=29.99, effective_from=date(2025, 1, 1))],
+            product_category="Electronics",
+            description="A test product",
+            image_url_arr=["https://example.com"],
+            fulfilment_class="Small"
+        )
+        
+        assert product.image_url_arr == ["https://example.com"]
+    
+    @pytest.mark.parametrize("field", ["active", "visible"])
+    def test_product_entry_flags_must_be_0_or_1(self, field):
+        """Test active and visible only accept 0 or 1."""
+        with pytest.raises(ValidationError, match="less than or equal to 1"):
+            ProductEntry(
+                vendor_sku="TEST123",
+                title="Test Product",
+                brand="Test Brand",
+                price_arr=[PriceEntry(price=29.99, effective_from=date(2025, 1, 1))],
+                product_category="Electronics",
+                description="A test product",
+                image_url_arr=["https://example.com/image.jpg"],
+                fulfilment_class="Small",
+                **{field: 2}
+            )
+    
+    @pytest.mark.parametrize("child_hazard, valid", [(-1, False), (0, True), (2, True), (3, False)])
+    def test_product_entry_child_hazard_bounds(self, child_hazard, valid):
+        """Test child_hazard accepts 0 to 2 inclusive."""
+        def build():
+            return ProductEntry(
+                vendor_sku="TEST123",
+                title="Test Product",
+                brand="Test Brand",
+                price_arr=[PriceEntry(price=29.99, effective_from=date(2025, 1, 1))],
+                product_category="Electronics",
+                description="A test product",
+                image_url_arr=["https://example.com/image.jpg"],
+                fulfilment_class="Small",
+                child_hazard=child_hazard
+            )
+        
+        if valid:
+            assert build().child_hazard == child_hazard
+        else:
+            with pytest.raises(ValidationError, match="child_hazard"):
+                build()
+    
     def test_product_entry_missing_required_fields(self):
         """Test ProductEntry missing required fields."""
         with pytest.raises(ValidationError):
@@ -232,7 +292,7 @@ class TestProductFeedClient:
     def setup_method(self):
         """Set up test fixtures."""
         # Create mock auth client
-        self.auth = Mock(spec=AuthClient)
+        self.auth = AuthClient("test_user", "test_pass", Config.uat())
         self.auth.session = Mock()
         self.auth.supplier_id = "12345"
         self.auth.mode = "test_mode"
@@ -317,11 +377,33 @@ class TestProductFeedClient:
         result = self.client.send_product_feed(request)
         
         assert result == mock_response
-        self.client._post.assert_called_once_with(
-            "product_feed.api",
-            request.model_dump(),
-            include_mode=False
+        self.client._post.assert_called_once_with("product_feed.api", ANY, include_mode=False)
+        # The model is posted as JSON bytes, with dates and URLs as strings
+        body = self.client._post.call_args[0][1]
+        assert isinstance(body, bytes)
+        assert json.loads(body) == request.model_dump(mode="json")
+    
+    def test_submit_products_validated(self):
+        """Test validated entries are posted as a product feed without a second validation pass."""
+        self.client._post = Mock(return_value={"status": "success"})
+        product = ProductEntry(
+            vendor_sku="TEST123",
+            title="Test Product",
+            brand="Test Brand",
+            price_arr=[PriceEntry(price=29.99, effective_from=date(2025, 1, 1))],
+            product_category="Electronics",
+            description="A test product",
+            image_url_arr=["https://example.com/image.jpg"],
+            fulfilment_class="Small"
         )
+        
+        with patch("therange.product_feed._PRODUCT_FEED_ADAPTER.validate_python") as validate:
+            result = self.client.submit_products_validated([product])
+        
+        assert result == {"status": "success"}
+        validate.assert_not_called()
+        body = json.loads(self.client._post.call_args[0][1])
+        assert body == {"product_arr": [product.model_dump(mode="json")]}
     
     def test_send_product_feed_no_session(self):
         """Test send_product_feed without authenticated session."""
@@ -393,6 +475,98 @@ class TestProductFeedClient:
         assert isinstance(call_args, ProductFeedRequest)
         assert len(call_args.product_arr) == 1
     
+    def test_send_product_feed_chunked(self):
+        """Test chunked feeds post one request per chunk and report bad chunks in place."""
+        self.client.send_product_feed = Mock(side_effect=[{"batch": 0}, {"batch": 2}])
+
+        product = {
+            "vendor_sku": "TEST123",
+            "title": "Test Product",
+            "brand": "Test Brand",
+            "price_arr": [{"price": 29.99, "effective_from": "2025-01-01"}],
+            "product_category": "Electronics",
+            "description": "A test product",
+            "image_url_arr": ["https://example.com/image.jpg"],
+            "fulfilment_class": "Small"
+        }
+        product_data = [{**product, "vendor_sku": f"SKU{i}"} for i in range(5)]
+        product_data[2]["title"] = "x" * 81
+
+        results = self.client.send_product_feed_chunked(product_data, chunk_size=2)
+
+        assert results[0] == {"batch": 0}
+        assert isinstance(results[1], ValueError)
+        assert results[2] == {"batch": 2}
+        assert [len(c.args[0].product_arr) for c in self.client.send_product_feed.call_args_list] == [2, 1]
+
+    def test_send_product_feed_chunked_stops_on_rejected_credentials(self):
+        """Test a PermissionError stops the feed instead of being recorded per chunk."""
+        self.client.send_product_feed = Mock(side_effect=PermissionError("Not authenticated."))
+        product = {
+            "vendor_sku": "TEST123",
+            "title": "Test Product",
+            "brand": "Test Brand",
+            "price_arr": [{"price": 29.99, "effective_from": "2025-01-01"}],
+            "product_category": "Electronics",
+            "description": "A test product",
+            "image_url_arr": ["https://example.com/image.jpg"],
+            "fulfilment_class": "Small"
+        }
+        product_data = [{**product, "vendor_sku": f"SKU{i}"} for i in range(5)]
+
+        with pytest.raises(PermissionError):
+            self.client.send_product_feed_chunked(product_data, chunk_size=2)
+        assert self.client.send_product_feed.call_count == 1
+
+    def test_send_product_feed_dict_dedupes_vendor_sku(self):
+        """Test repeated vendor_skus are sent once, keeping the last row, unless dedupe is off."""
+        self.client.send_product_feed = Mock(return_value={"status": "success"})
+        product = {
+            "vendor_sku": "TEST123",
+            "title": "Old Title",
+            "brand": "Test Brand",
+            "price_arr": [{"price": 29.99, "effective_from": "2025-01-01"}],
+            "product_category": "Electronics",
+            "description": "A test product",
+            "image_url_arr": ["https://example.com/image.jpg"],
+            "fulfilment_class": "Small"
+        }
+        product_data = [product, {**product, "vendor_sku": "OTHER"}, {**product, "title": "New Title"}]
+
+        self.client.send_product_feed_dict(product_data)
+        sent = self.client.send_product_feed.call_args[0][0].product_arr
+        assert [(p.vendor_sku, p.title) for p in sent] == [("TEST123", "New Title"), ("OTHER", "Old Title")]
+
+        self.client.send_product_feed_dict(product_data, dedupe=False)
+        assert len(self.client.send_product_feed.call_args[0][0].product_arr) == 3
+
+    def test_send_product_feed_dict_dedupe_errors_give_original_index(self):
+        """Test an invalid repeated product is reported at its index in product_data."""
+        self.client.send_product_feed = Mock()
+        product = {
+            "vendor_sku": "TEST123",
+            "title": "Test Product",
+            "brand": "Test Brand",
+            "price_arr": [{"price": 29.99, "effective_from": "2025-01-01"}],
+            "product_category": "Electronics",
+            "description": "A test product",
+            "image_url_arr": ["https://example.com/image.jpg"],
+            "fulfilment_class": "Small"
+        }
+        product_data = [product, {**product, "vendor_sku": "OTHER"}, {**product, "title": "x" * 81}]
+
+        with pytest.raises(ValueError, match=r"\nproduct_arr\.2\.title\n"):
+            self.client.send_product_feed_dict(product_data)
+        self.client.send_product_feed.assert_not_called()
+
+    def test_send_product_feed_chunked_invalid_chunk_size(self):
+        """Test chunk_size below 1 is rejected before anything is sent."""
+        self.client._post = Mock()
+
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            self.client.send_product_feed_chunked([{"vendor_sku": "TEST123"}], chunk_size=0)
+        self.client._post.assert_not_called()
+
     def test_send_product_feed_dict_not_list(self):
         """Test send_product_feed_dict with non-list input."""
         with pytest.raises(ValueError, match="product_data must be a list"):
@@ -436,11 +610,11 @@ class TestProductFeedClient:
         result = self.client.send_price_amendment(request)
         
         assert result == mock_response
-        self.client._post.assert_called_once_with(
-            "product_feed.api",
-            request.model_dump(),
-            include_mode=False
-        )
+        self.client._post.assert_called_once_with("product_feed.api", ANY, include_mode=False)
+        # The model is posted as JSON bytes, with dates and URLs as strings
+        body = self.client._post.call_args[0][1]
+        assert isinstance(body, bytes)
+        assert json.loads(body) == request.model_dump(mode="json")
     
     def test_send_price_amendment_no_session(self):
         """Test send_price_amendment without authenticated session."""
@@ -523,7 +697,7 @@ class TestProductFeedEdgeCases:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.auth = Mock(spec=AuthClient)
+        self.auth = AuthClient("test_user", "test_pass", Config.uat())
         self.auth.session = Mock()
         self.auth.supplier_id = "12345"
         self.auth.mode = "test_mode"
@@ -22,6 +22,36 @@ def test_package_import():
     assert hasattr(therange, 'TheRangeManager')
 
 
+def test_package_import_defers_requests():
+    """Test that importing the package does not import requests until a client needs it."""
+    import subprocess
+    import sys
+    code = "import sys, therange; assert 'requests' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_manager_imports_sub_clients_on_first_use():
+    """Test TheRangeManager defers importing a sub-client module until it is accessed."""
+    import subprocess
+    import sys
+    code = (
+        "import sys; from therange import TheRangeManager, Config; "
+        "m = TheRangeManager('u', 'p', Config.uat()); "
+        "assert 'therange.order_feed' not in sys.modules; "
+        "assert m.order_feed is m.order_feed and m.order_feed.auth is m.auth; "
+        "assert 'therange.order_feed' in sys.modules and 'therange.product_feed' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_order_feed_does_not_import_other_clients():
+    """Test importing one client module does not build another client's request models."""
+    import subprocess
+    import sys
+    code = "import sys, therange.order_feed; assert 'therange.order_event' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_delivery_service_enum_values():
     """Test all DeliveryService enum values."""
     from therange.delivery_service import DeliveryService
@@ -5,12 +5,21 @@ Tests stock availability functionality including initialization, successful upda
 and various error scenarios using mocked HTTP requests.
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import MagicMock, Mock, patch
 from pydantic import ValidationError
 from therange.auth import AuthClient
 from therange.config import Config
-from therange.stock_availability import StockAvailabilityClient, StockItem
+from therange.stock_availability import StockAvailabilityClient, StockItem, _stock_rows, _validate_fast
+
+
+_PROD_CONFIG = Config.production()
+
+# Shared 200 response; tests only read from it
+_OK_RESPONSE = Mock(status_code=200, text="OK")
+_OK_RESPONSE.content = json.dumps({"status": "success"}).encode()
 
 
 class TestStockItem:
@@ -46,6 +55,18 @@ class TestStockItem:
             StockItem(code="PROD123")
         assert "Field required" in str(exc_info.value)
     
+    def test_stock_item_is_frozen(self):
+        """Test StockItem instances are immutable."""
+        item = StockItem(code="PROD123", qty=10)
+        with pytest.raises(ValidationError):
+            item.qty = 5
+    
+    def test_stock_item_rejects_unknown_fields(self):
+        """Test StockItem rejects fields the API does not accept."""
+        with pytest.raises(ValidationError) as exc_info:
+            StockItem(code="PROD123", qty=10, price=9.99)
+        assert "Extra inputs are not permitted" in str(exc_info.value)
+    
     def test_stock_item_invalid_qty_type(self):
         """Test StockItem with invalid qty type."""
         with pytest.raises(ValidationError) as exc_info:
@@ -53,13 +74,79 @@ class TestStockItem:
         assert "Input should be a valid integer" in str(exc_info.value)
 
 
+@pytest.fixture
+def mock_client():
+    """Return an authenticated StockAvailabilityClient and its mocked session."""
+    auth = AuthClient("test_user", "test_pass", _PROD_CONFIG)
+    auth.session = MagicMock(spec=requests.Session)
+    auth.supplier_id = "12345"
+    auth.base_url = "https://test.example.com/rest/"
+    return StockAvailabilityClient(auth), auth.session
+
+
+class TestValidateFast:
+    """Test the canonical-shape fast path used by update_stock."""
+    
+    def test_accepts_canonical_rows(self):
+        """Test exact code/qty dicts take the fast path."""
+        assert _validate_fast([{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": 0}])
+    
+    @pytest.mark.parametrize("row", [
+        {"code": "PROD123", "qty": "10"},
+        {"code": "PROD123", "qty": True},
+        {"code": "PROD123", "qty": -1},
+        {"code": "PROD123"},
+        {"code": "PROD123", "qty": 1, "price": 9.99},
+        {"code": "PROD123", "price": 9.99},
+        ("PROD123", 10),
+    ])
+    def test_rejects_anything_else(self, row):
+        """Test any row needing coercion or error reporting falls back to Pydantic."""
+        assert not _validate_fast([{"code": "OK", "qty": 1}, row])
+    
+    def test_strict_always_builds_models(self):
+        """Test validate='strict' runs Pydantic even on canonical rows."""
+        rows = _stock_rows([{"code": "PROD123", "qty": 10}], validate="strict")
+        
+        assert rows == [StockItem(code="PROD123", qty=10)]
+    
+    def test_dedupe_keeps_last_row_per_code(self):
+        """Test repeated codes collapse to the last row, at the first row's position."""
+        rows = _stock_rows([{"code": "A", "qty": 1}, {"code": "B", "qty": 2}, {"code": "A", "qty": 3}])
+        
+        assert rows == [{"code": "A", "qty": 3}, {"code": "B", "qty": 2}]
+    
+    def test_dedupe_errors_give_original_row_index(self):
+        """Test errors in a deduplicated row report its index in the rows given."""
+        rows = [{"code": "A", "qty": 1}, {"code": "B", "qty": 2}, {"code": "A", "qty": -1}, {"code": "C", "qty": -2}]
+        
+        with pytest.raises(ValueError) as exc_info:
+            _stock_rows(rows)
+        
+        message = str(exc_info.value)
+        assert "\n2.qty\n" in message and "\n3.qty\n" in message
+        assert "\n0.qty\n" not in message
+    
+    def test_dedupe_off_or_malformed_rows_keep_every_row(self):
+        """Test dedupe=False, or rows without a code, leave the rows as given."""
+        rows = [{"code": "A", "qty": 1}, {"code": "A", "qty": 3}]
+        assert _stock_rows(rows, dedupe=False) == rows
+        
+        with pytest.raises(ValueError, match="Invalid stock data"):
+            _stock_rows([{"code": "A", "qty": 1}, {"qty": 3}])
+    
+    def test_unknown_validate_mode_raises(self):
+        """Test an unrecognised validate mode is rejected."""
+        with pytest.raises(ValueError, match="validate must be one of"):
+            _stock_rows([{"code": "PROD123", "qty": 10}], validate="loose")
+
+
 class TestStockAvailabilityClientInitialization:
     """Test StockAvailabilityClient initialization."""
     
     def test_init_with_auth_client(self):
         """Test initialization with auth client."""
-        config = Config.production()
-        auth = AuthClient("test_user", "test_pass", config)
+        auth = AuthClient("test_user", "test_pass", _PROD_CONFIG)
         client = StockAvailabilityClient(auth)
         
         assert client.auth is auth
@@ -70,9 +157,9 @@ class TestStockAvailabilityClientUpdateStock:
     
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        config = Config.production()
-        self.auth = AuthClient("test_user", "test_pass", config)
-        self.auth.session = Mock()
+        self.auth = AuthClient("test_user", "test_pass", _PROD_CONFIG)
+        self.auth.session = MagicMock(spec=requests.Session)
+        self.auth.session.cookies = requests.cookies.RequestsCookieJar()
         self.auth.supplier_id = "12345"
         self.auth.mode = "test_mode"
         self.auth.base_url = "https://test.example.com/rest/"
@@ -80,13 +167,7 @@ class TestStockAvailabilityClientUpdateStock:
     
     def test_update_stock_success(self):
         """Test successful stock update."""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = "OK"
-        self.auth.session.post.return_value = mock_response
+        self.auth.session.post.return_value = _OK_RESPONSE
         
         # Test data
         stock_data = [
@@ -102,7 +183,10 @@ class TestStockAvailabilityClientUpdateStock:
         expected_url = "https://test.example.com/rest/stock_availability.api?supplier_id=12345"
         expected_payload = stock_data  # Should be same as input after validation
         
-        self.auth.session.post.assert_called_once_with(expected_url, json=expected_payload)
+        self.auth.session.post.assert_called_once_with(
+            expected_url, data=json.dumps(expected_payload, separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json"}
+        )
         assert result == {"status": "success"}
     
     def test_update_stock_no_session(self):
@@ -134,6 +218,12 @@ class TestStockAvailabilityClientUpdateStock:
         
         assert "stock_data must be a list" in str(exc_info.value)
     
+    def test_update_stock_tuple_rejected(self):
+        """Test a tuple of valid rows is still rejected as not a list."""
+        with pytest.raises(ValueError, match="stock_data must be a list"):
+            self.client.update_stock(({"code": "PROD123", "qty": 10},))
+        self.auth.session.post.assert_not_called()
+    
     def test_update_stock_empty_list(self):
         """Test update_stock with empty list."""
         with pytest.raises(ValueError) as exc_info:
@@ -141,57 +231,44 @@ class TestStockAvailabilityClientUpdateStock:
         
         assert "stock_data must be a non-empty list" in str(exc_info.value)
     
-    def test_update_stock_invalid_item_missing_code(self):
-        """Test update_stock with item missing code field."""
-        stock_data = [{"qty": 10}]  # Missing 'code'
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.client.update_stock(stock_data)
-        
-        assert "Invalid stock data:" in str(exc_info.value)
-        assert "Field required" in str(exc_info.value)
-    
-    def test_update_stock_invalid_item_missing_qty(self):
-        """Test update_stock with item missing qty field."""
-        stock_data = [{"code": "PROD123"}]  # Missing 'qty'
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.client.update_stock(stock_data)
+    @pytest.mark.parametrize("stock_data, match", [
+        ([{"qty": 10}], "Field required"),
+        ([{"code": "PROD123"}], "Field required"),
+        ([{"code": "PROD123", "qty": -5}], "Input should be greater than or equal to 0"),
+        ([{"code": "PROD123", "qty": "not_a_number"}], "Input should be a valid integer"),
+        ([{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": -1}], "greater than or equal to 0"),
+    ], ids=["missing_code", "missing_qty", "negative_qty", "wrong_qty_type", "mixed_valid_invalid"])
+    def test_update_stock_validation_errors(self, mock_client, stock_data, match):
+        """Test update_stock rejects each invalid item shape without calling the API."""
+        client, session = mock_client
+        
+        with pytest.raises(ValueError, match=rf"(?s)^Invalid stock data:.*{match}"):
+            client.update_stock(stock_data)
         
-        assert "Invalid stock data:" in str(exc_info.value)
-        assert "Field required" in str(exc_info.value)
+        session.post.assert_not_called()
     
-    def test_update_stock_invalid_item_negative_qty(self):
-        """Test update_stock with negative quantity."""
-        stock_data = [{"code": "PROD123", "qty": -5}]
+    def test_update_stock_json_success(self):
+        """Test update_stock_json validates raw JSON and posts the parsed items."""
+        self.auth.session.post.return_value = _OK_RESPONSE
         
-        with pytest.raises(ValueError) as exc_info:
-            self.client.update_stock(stock_data)
+        result = self.client.update_stock_json(b'[{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": 0}]')
         
-        assert "Invalid stock data:" in str(exc_info.value)
-        assert "Input should be greater than or equal to 0" in str(exc_info.value)
+        expected_url = "https://test.example.com/rest/stock_availability.api?supplier_id=12345"
+        expected_payload = [{"code": "PROD123", "qty": 10}, {"code": "PROD456", "qty": 0}]
+        call_args = self.auth.session.post.call_args
+        assert call_args.args[0] == expected_url
+        assert json.loads(call_args.kwargs['data']) == expected_payload
+        assert result == {"status": "success"}
     
-    def test_update_stock_invalid_item_wrong_qty_type(self):
-        """Test update_stock with invalid qty type."""
-        stock_data = [{"code": "PROD123", "qty": "not_a_number"}]
-        
+    def test_update_stock_json_invalid(self):
+        """Test update_stock_json with malformed and empty input."""
         with pytest.raises(ValueError) as exc_info:
-            self.client.update_stock(stock_data)
-        
+            self.client.update_stock_json('[{"code": "PROD123", "qty": -1}]')
         assert "Invalid stock data:" in str(exc_info.value)
-        assert "Input should be a valid integer" in str(exc_info.value)
-    
-    def test_update_stock_mixed_valid_invalid(self):
-        """Test update_stock with mix of valid and invalid items."""
-        stock_data = [
-            {"code": "PROD123", "qty": 10},  # Valid
-            {"code": "PROD456", "qty": -1}   # Invalid (negative qty)
-        ]
         
         with pytest.raises(ValueError) as exc_info:
-            self.client.update_stock(stock_data)
-        
-        assert "Invalid stock data:" in str(exc_info.value)
+            self.client.update_stock_json('[]')
+        assert "stock_data must be a non-empty list" in str(exc_info.value)
     
     def test_update_stock_http_401_error(self):
         """Test update_stock with 401 HTTP error."""
@@ -240,13 +317,7 @@ class TestStockAvailabilityClientUpdateStock:
     
     def test_update_stock_include_mode_false(self):
         """Test that update_stock calls _post with include_mode=False."""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = "OK"
-        self.auth.session.post.return_value = mock_response
+        self.auth.session.post.return_value = _OK_RESPONSE
         
         stock_data = [{"code": "PROD123", "qty": 10}]
         
@@ -255,7 +326,7 @@ class TestStockAvailabilityClientUpdateStock:
         
         # Verify that mode was NOT added to payload (include_mode=False)
         call_args = self.auth.session.post.call_args
-        payload = call_args.kwargs['json']
+        payload = json.loads(call_args.kwargs['data'])
         
         # Mode should not be in payload since include_mode=False
         assert 'mode' not in payload
@@ -266,18 +337,10 @@ class TestStockAvailabilityClientUpdateStock:
     
     def test_update_stock_no_supplier_id_in_url_when_none(self):
         """Test that supplier_id is not added to URL when auth.supplier_id is None."""
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = "OK"
-        
         # Create new auth with supplier_id None but valid session
-        config = Config.production()
-        auth_no_supplier = AuthClient("test_user", "test_pass", config)
-        auth_no_supplier.session = Mock()
-        auth_no_supplier.session.post.return_value = mock_response
+        auth_no_supplier = AuthClient("test_user", "test_pass", _PROD_CONFIG)
+        auth_no_supplier.session = MagicMock(spec=requests.Session)
+        auth_no_supplier.session.post.return_value = _OK_RESPONSE
         auth_no_supplier.supplier_id = None  # This should cause validation error
         auth_no_supplier.base_url = "https://test.example.com/rest/"
         
@@ -296,9 +359,8 @@ class TestStockAvailabilityClientEdgeCases:
     
     def test_update_stock_large_dataset(self):
         """Test update_stock with large dataset."""
-        config = Config.production()
-        auth = AuthClient("test_user", "test_pass", config)
-        auth.session = Mock()
+        auth = AuthClient("test_user", "test_pass", _PROD_CONFIG)
+        auth.session = MagicMock(spec=requests.Session)
         auth.supplier_id = "12345"
         auth.base_url = "https://test.example.com/rest/"
         client = StockAvailabilityClient(auth)
@@ -306,7 +368,7 @@ class TestStockAvailabilityClientEdgeCases:
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success", "updated": 1000}
+        mock_response.content = json.dumps({"status": "success", "updated": 1000}).encode()
         mock_response.raise_for_status.return_value = None
         mock_response.text = "OK"
         auth.session.post.return_value = mock_response
@@ -322,20 +384,13 @@ class TestStockAvailabilityClientEdgeCases:
     
     def test_update_stock_special_characters_in_code(self):
         """Test update_stock with special characters in product codes."""
-        config = Config.production()
-        auth = AuthClient("test_user", "test_pass", config)
-        auth.session = Mock()
+        auth = AuthClient("test_user", "test_pass", _PROD_CONFIG)
+        auth.session = MagicMock(spec=requests.Session)
         auth.supplier_id = "12345"
         auth.base_url = "https://test.example.com/rest/"
         client = StockAvailabilityClient(auth)
         
-        # Setup mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "success"}
-        mock_response.raise_for_status.return_value = None
-        mock_response.text = "OK"
-        auth.session.post.return_value = mock_response
+        auth.session.post.return_value = _OK_RESPONSE
         
         # Test with special characters
         stock_data = [
@@ -351,5 +406,68 @@ class TestStockAvailabilityClientEdgeCases:
         
         # Verify payload contains the special characters as-is
         call_args = auth.session.post.call_args
-        payload = call_args.kwargs['json']
-        assert payload == stock_data
\ No newline at end of file
+        payload = json.loads(call_args.kwargs['data'])
+        assert payload == stock_data
+
+
+class TestStockAvailabilityClientUpdateStockBulk:
+    """Test StockAvailabilityClient update_stock_bulk functionality."""
+    
+    def test_update_stock_bulk_splits_into_chunks(self, mock_client):
+        """Test rows are split into chunk_size requests and responses keep input order."""
+        client, session = mock_client
+        session.post.return_value = _OK_RESPONSE
+        
+        stock_data = [{"code": f"PROD{i:04d}", "qty": i} for i in range(1200)]
+        
+        result = client.update_stock_bulk(stock_data, chunk_size=500, max_workers=3)
+        
+        assert result == [{"status": "success"}] * 3
+        assert session.post.call_count == 3
+        posted = [json.loads(call.kwargs['data']) for call in session.post.call_args_list]
+        assert sorted(len(rows) for rows in posted) == [200, 500, 500]
+        assert sorted(row["code"] for rows in posted for row in rows) == [row["code"] for row in stock_data]
+        for call in session.post.call_args_list:
+            assert call.args[0] == "https://test.example.com/rest/stock_availability.api?supplier_id=12345"
+    
+    def test_update_stock_bulk_returns_failed_chunk_in_place(self, mock_client):
+        """Test a failed middle chunk is returned in place alongside the chunks that landed."""
+        client, session = mock_client
+        rejected = Mock(status_code=400, text="Invalid stock payload")
+        session.post.side_effect = lambda url, data, headers: (
+            rejected if json.loads(data)[0]["code"] == "PROD2" else _OK_RESPONSE
+        )
+        
+        result = client.update_stock_bulk([{"code": f"PROD{i}", "qty": i} for i in range(6)], chunk_size=2)
+        
+        assert result[0] == {"status": "success"}
+        assert isinstance(result[1], ValueError)
+        assert "Invalid stock payload" in str(result[1])
+        assert result[2] == {"status": "success"}
+        assert session.post.call_count == 3
+    
+    def test_update_stock_bulk_coerces_via_pydantic(self, mock_client):
+        """Test rows outside the fast path are validated and serialized by pydantic."""
+        client, session = mock_client
+        session.post.return_value = _OK_RESPONSE
+        
+        client.update_stock_bulk([{"code": "PROD123", "qty": "7"}])
+        
+        assert json.loads(session.post.call_args.kwargs['data']) == [{"code": "PROD123", "qty": 7}]
+    
+    def test_update_stock_bulk_invalid_row_sends_nothing(self, mock_client):
+        """Test a single invalid row fails the whole batch before any request."""
+        client, session = mock_client
+        stock_data = [{"code": f"PROD{i}", "qty": 1} for i in range(10)] + [{"code": "BAD", "qty": -1}]
+        
+        with pytest.raises(ValueError, match="Invalid stock data:"):
+            client.update_stock_bulk(stock_data, chunk_size=2)
+        
+        session.post.assert_not_called()
+    
+    def test_update_stock_bulk_invalid_chunk_size(self, mock_client):
+        """Test chunk_size must be positive."""
+        client, _ = mock_client
+        
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            client.update_stock_bulk([{"code": "PROD123", "qty": 1}], chunk_size=0)
@@ -1,2 +1,4 @@
+__version__ = "0.2.0"
+
 from .manager import TheRangeManager
 from .config import Config, EnvironmentConfig
@@ -0,0 +1,34 @@
+"""
+Date checks shared by the order clients, kept free of Pydantic models so
+importing one client does not build another client's request schemas.
+"""
+
+import re
+from calendar import monthrange
+from datetime import datetime
+
+# Same dates datetime.strptime accepts for '%Y-%m-%d[ %H:%M:%S]', ASCII digits only
+DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+DATETIME_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{1,2}):(\d{1,2})", re.ASCII)
+
+
+def is_date(v, pattern=DATE_RE):
+    """Return True if v fully matches pattern and names a real calendar date and time."""
+    m = pattern.fullmatch(v)
+    if not m:
+        return False
+    year, month, day, *time = map(int, m.groups())
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]):
+        return False
+    return not time or (time[0] <= 23 and time[1] <= 59 and time[2] <= 59)
+
+
+def parse_datetime(v):
+    """Parse a 'YYYY-MM-DD HH:MM:SS' string without strptime, returning None if it is not one."""
+    m = DATETIME_RE.fullmatch(v)
+    if not m:
+        return None
+    try:
+        return datetime(*map(int, m.groups()))
+    except ValueError:
+        return None
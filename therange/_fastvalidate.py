@@ -0,0 +1,23 @@
+"""
+Hand-rolled checks for the hottest validation loops.
+
+Plain, fully annotated Python so the module can be compiled with mypyc
+(``THERANGE_MYPYC=1 pip install .``); the interpreted module is used
+otherwise and behaves identically.
+"""
+
+
+def is_canonical_stock(stock_data: list) -> bool:
+    """Return True if every row is already an exact {'code': str, 'qty': int >= 0} dict.
+    
+    Any anomaly (extra keys, coercible types, bad values) returns False so the
+    caller falls back to full Pydantic validation and its detailed errors.
+    """
+    for item in stock_data:
+        if type(item) is not dict or len(item) != 2:
+            return False
+        code = item.get("code")
+        qty = item.get("qty")
+        if type(code) is not str or type(qty) is not int or qty < 0:
+            return False
+    return True
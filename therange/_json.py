@@ -0,0 +1,18 @@
+"""
+JSON encoding for request and response bodies.
+
+Uses orjson when it is installed (``pip install therange-sdk[fast]``) and
+otherwise pydantic-core's Rust encoder, which pydantic already brings in.
+Both produce compact UTF-8 bytes, so bodies go on the wire without a
+str -> bytes re-encode.
+"""
+
+try:
+    import orjson
+except ImportError:
+    from pydantic_core import from_json as loads, to_json as dumps
+else:
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+__all__ = ["dumps", "loads"]
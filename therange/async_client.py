@@ -0,0 +1,256 @@
+"""
+asyncio clients for The Range Marketplace API, backed by httpx over HTTP/2.
+
+HTTP/2 multiplexes every concurrent request onto one TLS connection, so
+bulk acknowledgements and dispatches issued with asyncio.gather are not
+limited by the connection pool. Requires the optional ``httpx`` dependency
+(``pip install therange-sdk[http2]``); the synchronous API is unchanged.
+"""
+
+import asyncio
+import sys
+from typing import List
+from urllib.parse import urlparse
+from . import __version__
+from ._json import dumps, loads
+from .auth import CompiledEndpoints, _intern, _ksi_from_header
+from .base_client import _JSON_HEADERS, _endpoint_url, _read_response
+from .config import Config
+from .order_ack import _ORDER_ACK_API, _validated_order_numbers
+from .order_event import _ORDER_EVENT_API, _cancel_payload, _dispatch_payload
+
+
+def _build_client(pool_maxsize=32):
+    """Create an HTTP/2 httpx.AsyncClient shared by every async sub-client."""
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError("AsyncTheRangeManager requires httpx: pip install therange-sdk[http2]") from e
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        timeout=30,
+        headers={"User-Agent": f"therange-sdk/{__version__}"},
+    )
+
+
+class AsyncAuthClient:
+    def __init__(self, username, password, config: Config, client=None):
+        """
+        Initialize AsyncAuthClient.
+
+        Args:
+            username: The username for authentication
+            password: The password for authentication
+            config: Configuration object specifying the environment to use
+            client: Optional existing httpx.AsyncClient. An HTTP/2 client is
+                created on first use and closed by aclose() when omitted.
+        """
+        self.username = username
+        self.password = password
+        self.config = config
+        self.base_url = config.base_url
+        self.mode = None
+        self.ksi = None
+        self.supplier_id = None
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = _build_client(self.config.pool_maxsize)
+        return self._client
+
+    async def aclose(self):
+        """Close the httpx client if this auth client created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def authenticate(self):
+        """
+        Log in and record the ksi session cookie, mode and supplier_id.
+
+        Raises:
+            PermissionError: If the credentials are rejected (401)
+            ValueError: If the request is malformed (400)
+            RuntimeError: If the response carries no ksi cookie
+        """
+        # Drop any earlier ksi, so the client never carries two of them
+        self._clear_ksi_cookies()
+        url = CompiledEndpoints.build(self.base_url).authenticate_url
+        body = dumps({"user": self.username, "pass": self.password})
+        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
+        status = response.status_code
+        if not 200 <= status < 300:
+            if status == 401:
+                raise PermissionError("Unauthorized: Invalid credentials")
+            elif status == 400:
+                raise ValueError(f"Bad request: {response.text}")
+            response.raise_for_status()
+
+        ksi = (
+            response.cookies.get("ksi")
+            or self.client.cookies.get("ksi")
+            or _ksi_from_header(response.headers.get("set-cookie", ""))
+        )
+        if not ksi:
+            raise RuntimeError("Authentication failed: 'ksi' cookie missing")
+        self._set_ksi_cookie(ksi)
+
+        data = loads(response.content)
+        self.ksi = ksi
+        self.mode = _intern(data.get("mode"))
+        self.supplier_id = sys.intern(str(data.get("supplier_id")))
+        return data
+
+    def _clear_ksi_cookies(self):
+        # httpx.Cookies wraps its http.cookiejar.CookieJar as .jar
+        cookies = self.client.cookies
+        jar = getattr(cookies, "jar", cookies)
+        for cookie in [c for c in jar if c.name == "ksi"]:
+            jar.clear(cookie.domain, cookie.path, cookie.name)
+
+    def _set_ksi_cookie(self, ksi):
+        # Scoped to the API host, so a caller's shared client never sends it elsewhere
+        self._clear_ksi_cookies()
+        self.client.cookies.set("ksi", ksi, domain=urlparse(self.base_url).hostname)
+
+
+class AsyncBaseClient:
+    def __init__(self, auth_client):
+        self.auth = auth_client
+
+    def _require_auth(self):
+        if not self.auth.ksi or not self.auth.supplier_id:
+            raise ValueError("Must be authenticated before making this call")
+
+    async def _post(self, endpoint, payload, include_supplier_id=True, include_mode=True):
+        try:
+            return await self._post_once(endpoint, payload, include_supplier_id, include_mode)
+        except PermissionError as expired:
+            # The ksi has most likely expired: log in again and replay the request once
+            try:
+                await self.auth.authenticate()
+            except PermissionError:
+                raise expired
+            return await self._post_once(endpoint, payload, include_supplier_id, include_mode)
+
+    async def _post_once(self, endpoint, payload, include_supplier_id, include_mode):
+        if include_mode and self.auth.mode:
+            if isinstance(payload, bytes):
+                raise ValueError("Cannot add mode to a pre-serialized payload; pass include_mode=False")
+            # Copy rather than mutate, so callers can reuse their payload
+            payload = {**payload, "mode": self.auth.mode}
+
+        supplier_id = self.auth.supplier_id if include_supplier_id else None
+        url = _endpoint_url(self.auth.base_url, endpoint, supplier_id)
+        body = payload if isinstance(payload, bytes) else dumps(payload)
+        response = await self.auth.client.post(url, content=body, headers=_JSON_HEADERS)
+        return _read_response(response)
+
+
+class AsyncOrderAckClient(AsyncBaseClient):
+    async def acknowledge_orders(self, order_numbers: List[str]):
+        """Acknowledge orders received via order_feed.api with type='new'.
+
+        Args:
+            order_numbers: List of order numbers (strings) to acknowledge
+
+        Returns:
+            API response containing acknowledged order_arr
+        """
+        order_arr = _validated_order_numbers(order_numbers)
+        self._require_auth()
+        return await self._post(_ORDER_ACK_API, {"order_arr": order_arr})
+
+    async def acknowledge_orders_bulk(self, order_numbers: List[str], chunk_size: int = 500):
+        """Acknowledge a large list of orders in chunks sent concurrently.
+
+        The whole list is validated before anything is sent. Each chunk is an
+        independent API call, so one failure does not stop the others; its
+        exception is returned in place of a response.
+
+        Args:
+            order_numbers: List of order numbers (strings) to acknowledge
+            chunk_size: Maximum number of order numbers per request
+
+        Returns:
+            List holding, for each chunk in input order, the API response or
+            the exception raised while sending it
+        """
+        order_arr = _validated_order_numbers(order_numbers)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._require_auth()
+        return list(await asyncio.gather(*(
+            self._post(_ORDER_ACK_API, {"order_arr": order_arr[i:i + chunk_size]})
+            for i in range(0, len(order_arr), chunk_size)
+        ), return_exceptions=True))
+
+
+class AsyncOrderEventClient(AsyncBaseClient):
+    async def send_event(self, event_payload):
+        return await self._post(_ORDER_EVENT_API, event_payload)
+
+    async def dispatch_order(self, order_number: str, items: list, despatch_date: str, delivery_service: str,
+                             courier_name: str, tracking_reference: str, earliest_delivery: str = None,
+                             latest_delivery: str = None):
+        """Dispatch an order by sending a dispatch event; arguments match OrderEventClient.dispatch_order."""
+        self._require_auth()
+        payload = _dispatch_payload(
+            order_number, items, despatch_date, delivery_service, courier_name,
+            tracking_reference, earliest_delivery, latest_delivery
+        )
+        return await self._post(_ORDER_EVENT_API, payload)
+
+    async def dispatch_orders(self, dispatches: List[dict]):
+        """Dispatch many orders concurrently.
+
+        Args:
+            dispatches: List of dicts of dispatch_order keyword arguments
+
+        Returns:
+            List holding, for each dispatch in input order, the API response or
+            the exception dispatch_order raised for it
+        """
+        return list(await asyncio.gather(
+            *(self.dispatch_order(**dispatch) for dispatch in dispatches), return_exceptions=True
+        ))
+
+    async def cancel_order(self, order_number: str, items: list, cancel_code: str, cancel_reason: str = ""):
+        """Cancel an order by sending a cancellation event; arguments match OrderEventClient.cancel_order."""
+        self._require_auth()
+        payload = _cancel_payload(order_number, items, cancel_code, cancel_reason)
+        return await self._post(_ORDER_EVENT_API, payload)
+
+
+class AsyncTheRangeManager:
+    """asyncio counterpart of TheRangeManager for order acknowledgements and events."""
+
+    def __init__(self, username, password, config: Config, client=None):
+        """
+        Initialize AsyncTheRangeManager.
+
+        Args:
+            username: The username for authentication
+            password: The password for authentication
+            config: Configuration object specifying the environment to use
+            client: Optional existing httpx.AsyncClient to send requests through
+        """
+        self.auth = AsyncAuthClient(username, password, config, client=client)
+        self.order_ack = AsyncOrderAckClient(self.auth)
+        self.order_event = AsyncOrderEventClient(self.auth)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def authenticate(self):
+        return await self.auth.authenticate()
+
+    async def aclose(self):
+        await self.auth.aclose()
@@ -0,0 +1,79 @@
+from typing import List
+from pydantic_core import to_json
+from ._json import loads
+from .base_client import _JSON_HEADERS
+from .stock_availability import _stock_rows
+
+
+class AsyncStockAvailabilityClient:
+    """asyncio counterpart of StockAvailabilityClient, backed by aiohttp.
+
+    Authentication stays with the synchronous AuthClient: authenticate it
+    first, and this client reuses its supplier_id, ksi cookie and endpoint
+    URLs. Requires the optional ``aiohttp`` dependency (``pip install
+    therange-sdk[async]``).
+    """
+
+    def __init__(self, auth_client, session=None):
+        """
+        Initialize AsyncStockAvailabilityClient.
+
+        Args:
+            auth_client: An authenticated AuthClient
+            session: Optional existing aiohttp.ClientSession. One is created on
+                first use and closed by aclose() when omitted.
+        """
+        self.auth = auth_client
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _get_session(self):
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError(
+                    "AsyncStockAvailabilityClient requires aiohttp: pip install therange-sdk[async]"
+                ) from e
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def aclose(self):
+        """Close the aiohttp session if this client created it."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def update_stock(self, stock_data: List[dict], validate: str = "fast", dedupe: bool = True):
+        """Update stock availability for products.
+
+        Args:
+            stock_data: List of dictionaries, each containing 'code' (str) and 'qty' (int >= 0)
+            validate: "fast" or "strict", as for StockAvailabilityClient.update_stock
+            dedupe: Send only the last row for each repeated code
+
+        Raises:
+            ValueError: If authentication state is invalid or stock_data validation fails
+        """
+        # Validate authentication state
+        if not self.auth.ksi or self.auth.endpoints.stock_url is None:
+            raise ValueError("Must be authenticated before making this call")
+
+        body = to_json(_stock_rows(stock_data, validate, dedupe))
+        url = self.auth.endpoints.stock_url
+
+        # ksi goes on each request, so a caller's session gets it and a re-login is picked up
+        cookies = {"ksi": self.auth.ksi}
+        async with self._get_session().post(url, data=body, headers=_JSON_HEADERS, cookies=cookies) as response:
+            if response.status == 401:
+                raise PermissionError("Not authenticated.")
+            elif response.status == 400:
+                raise ValueError(f"Bad request: {await response.text()}")
+            response.raise_for_status()
+            return loads(await response.read())
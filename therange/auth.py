@@ -1,9 +1,99 @@
-import requests
-from http.cookies import SimpleCookie
+import hashlib
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlencode, urlparse
+from ._json import dumps, loads
+from .base_client import _JSON_HEADERS
 from .config import Config
 
+# Successful logins keyed by (username, base_url, password digest) ->
+# (monotonic timestamp, response data, ksi), shared by every AuthClient in the process
+_AUTH_CACHE = {}
+_AUTH_CACHE_LOCK = threading.Lock()
+AUTH_CACHE_TTL = 45 * 60
+
+
+def clear_auth_cache():
+    """Forget every cached login, forcing the next authenticate() to hit the API."""
+    with _AUTH_CACHE_LOCK:
+        _AUTH_CACHE.clear()
+
+
+def __getattr__(name):
+    # requests (and urllib3, SSL, certifi) costs tens of milliseconds to import,
+    # so it is loaded on first use rather than when the package is imported
+    if name == "requests":
+        import requests
+        globals()["requests"] = requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _intern(value):
+    """Intern str values that are reused on every request; pass anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _ksi_from_header(raw):
+    """Slice the ksi value straight out of a raw Set-Cookie header, or return None."""
+    i = raw.find("ksi=")
+    # Require a cookie boundary so e.g. "dksi=" does not match
+    while i > 0 and raw[i - 1] not in " ;,":
+        i = raw.find("ksi=", i + 4)
+    if i == -1:
+        return None
+    j = raw.find(";", i + 4)
+    return raw[i + 4:j if j != -1 else len(raw)].strip().strip('"') or None
+
+
+def _build_session(pool_maxsize=32):
+    """Create a session whose TCP+TLS connections stay pooled across every sub-client call."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from . import __version__
+
+    session = requests.Session()
+    # Retry gateway errors on POST too; raise_on_status=False hands the last
+    # response back so the callers' status-code handling still applies
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["POST", "GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": f"therange-sdk/{__version__}", "Connection": "keep-alive"})
+    return session
+
+
+@dataclass(frozen=True)
+class CompiledEndpoints:
+    """Fully built endpoint URLs for one base_url / supplier_id pair.
+    
+    stock_url is None until a supplier_id is known, so it doubles as the
+    authenticated-state check for stock calls.
+    """
+    __slots__ = ("authenticate_url", "stock_url")
+    authenticate_url: str
+    stock_url: Optional[str]
+
+    @classmethod
+    def build(cls, base_url, supplier_id=None):
+        stock_url = None
+        if supplier_id:
+            stock_url = f"{base_url}stock_availability.api?{urlencode({'supplier_id': supplier_id})}"
+        return cls(authenticate_url=f"{base_url}authenticate.api", stock_url=stock_url)
+
+
 class AuthClient:
-    def __init__(self, username, password, config: Config):
+    def __init__(self, username, password, config: Config, session=None):
         """
         Initialize AuthClient.
         
@@ -11,34 +101,119 @@ class AuthClient:
             username: The username for authentication
             password: The password for authentication
             config: Configuration object specifying the environment to use
+            session: Optional existing requests.Session to send requests through,
+                e.g. to reuse its warm connection pool. A pooled session is
+                created when omitted.
         """
         self.username = username
         self.password = password
         self.config = config
         
-        self.session = requests.Session()
+        self._supplier_id = None
+        self.session = session if session is not None else _build_session(config.pool_maxsize)
         self.mode = None
-        self.supplier_id = None
         self.ksi = None
         self.base_url = self.config.base_url
 
-    def authenticate(self):
-        url = self.base_url + "authenticate.api"
-        response = self.session.post(url, json={"user": self.username, "pass": self.password})
-        if response.status_code == 401:
-            raise PermissionError("Unauthorized: Invalid credentials")
-        elif response.status_code == 400:
-            raise ValueError(f"Bad request: {response.text}")
-        response.raise_for_status()
-
-        cookie = SimpleCookie()
-        cookie.load(response.headers.get("Set-Cookie", ""))
-        if "ksi" not in cookie:
+    @property
+    def base_url(self):
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value):
+        self._base_url = value
+        self._refresh_endpoints()
+
+    @property
+    def session(self):
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        self._session = value
+        self._ready = bool(value and self._supplier_id)
+
+    @property
+    def supplier_id(self):
+        return self._supplier_id
+
+    @supplier_id.setter
+    def supplier_id(self, value):
+        self._supplier_id = value
+        self._ready = bool(self._session and value)
+        self._refresh_endpoints()
+
+    def _refresh_endpoints(self):
+        """Rebuild the compiled endpoint URLs whenever base_url or supplier_id changes."""
+        self.endpoints = CompiledEndpoints.build(self._base_url, self._supplier_id)
+
+    def authenticate(self, force=False):
+        """
+        Log in and record the ksi session cookie, mode and supplier_id.
+        
+        A successful login is cached per (username, password, base_url) for
+        AUTH_CACHE_TTL seconds and reused by any AuthClient in the process
+        without another round-trip.
+        
+        Args:
+            force: Skip the cache and always log in against the API
+        """
+        key = self._auth_cache_key()
+        if not force:
+            with _AUTH_CACHE_LOCK:
+                cached = _AUTH_CACHE.get(key)
+            if cached is not None and time.monotonic() - cached[0] < AUTH_CACHE_TTL:
+                _, data, ksi = cached
+                self._set_ksi_cookie(ksi)
+                return self._apply_login(ksi, dict(data))
+
+        # Drop any earlier ksi, so the session never carries two of them
+        self._clear_ksi_cookies()
+        url = self.endpoints.authenticate_url
+        body = dumps({"user": self.username, "pass": self.password})
+        response = self.session.post(url, data=body, headers=_JSON_HEADERS)
+        status = response.status_code
+        if not 200 <= status < 300:
+            if status == 401:
+                with _AUTH_CACHE_LOCK:
+                    _AUTH_CACHE.pop(key, None)
+                raise PermissionError("Unauthorized: Invalid credentials")
+            elif status == 400:
+                raise ValueError(f"Bad request: {response.text}")
+            response.raise_for_status()
+
+        # requests has already parsed Set-Cookie into both jars; the raw header
+        # is only scanned when the jar rejected the cookie (e.g. Domain mismatch)
+        ksi = response.cookies.get("ksi") or self.session.cookies.get("ksi")
+        if not ksi:
+            ksi = _ksi_from_header(response.headers.get("Set-Cookie", ""))
+            if ksi:
+                self._set_ksi_cookie(ksi)
+        if not ksi:
             raise RuntimeError("Authentication failed: 'ksi' cookie missing")
-        self.ksi = cookie['ksi'].value
-        self.session.cookies.set("ksi", self.ksi)
 
-        data = response.json()
-        self.mode = data.get("mode")
-        self.supplier_id = str(data.get("supplier_id"))
+        data = loads(response.content)
+        with _AUTH_CACHE_LOCK:
+            _AUTH_CACHE[key] = (time.monotonic(), dict(data), ksi)
+        return self._apply_login(ksi, data)
+
+    def _clear_ksi_cookies(self):
+        jar = self.session.cookies
+        for cookie in [c for c in jar if c.name == "ksi"]:
+            jar.clear(cookie.domain, cookie.path, cookie.name)
+
+    def _set_ksi_cookie(self, ksi):
+        # Scoped to the API host, so a caller's shared session never sends it elsewhere
+        self._clear_ksi_cookies()
+        self.session.cookies.set("ksi", ksi, domain=urlparse(self.base_url).hostname)
+
+    def _auth_cache_key(self):
+        # The password digest keeps a wrong password from reusing another login
+        digest = hashlib.sha256(str(self.password).encode()).hexdigest()
+        return (self.username, self.base_url, digest)
+
+    def _apply_login(self, ksi, data):
+        self.ksi = ksi
+        self.mode = _intern(data.get("mode"))
+        self.supplier_id = sys.intern(str(data.get("supplier_id")))
         return data
@@ -1,24 +1,109 @@
+from functools import lru_cache
+from urllib.parse import urlencode
+from pydantic_core import ValidationError
+from ._json import dumps, loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=256)
+def _endpoint_url(base_url, endpoint, supplier_id=None):
+    """Build (once per base_url/endpoint/supplier_id) the fully qualified URL for an endpoint."""
+    url = f"{base_url}{endpoint}"
+    if supplier_id:
+        url += "?" + urlencode({"supplier_id": supplier_id})
+    return url
+
+
+def _check_response(response):
+    """Map API error statuses to exceptions."""
+    status = response.status_code
+    if 200 <= status < 300:
+        # Nothing for raise_for_status() to find on the common path
+        return
+    if status == 401:
+        raise PermissionError("Not authenticated.")
+    elif status == 400:
+        raise ValueError(f"Bad request: {response.text}")
+
+    response.raise_for_status()
+
+
+def _read_response(response):
+    """Check the response status and decode a successful JSON response."""
+    _check_response(response)
+    return loads(response.content)
+
+
+def _last_per_key(rows, key):
+    """Drop rows repeating an earlier row's key; the last row for a key wins, at the first one's position.
+    
+    rows is returned unchanged if any row is not a mapping with a hashable
+    key, leaving that row for validation to report.
+    """
+    try:
+        unique = {row[key]: row for row in rows}
+    except (KeyError, TypeError):
+        return rows
+    return rows if len(unique) == len(rows) else list(unique.values())
+
+
+def _reindex_errors(error, deduped, rows, depth=0):
+    """Return a copy of a ValidationError for deduped with row indices pointing into rows.
+    
+    deduped is what _last_per_key returned for rows, and depth is where the
+    row index sits in each error's loc.
+    """
+    # A key's last row is the one kept, so the last index seen for it wins
+    position = {id(row): i for i, row in enumerate(rows)}
+    line_errors = []
+    for e in error.errors():
+        loc = e["loc"]
+        if len(loc) > depth and isinstance(loc[depth], int):
+            loc = loc[:depth] + (position[id(deduped[loc[depth]])],) + loc[depth + 1:]
+        line_error = {"type": e["type"], "loc": loc, "input": e["input"]}
+        if "ctx" in e:
+            line_error["ctx"] = e["ctx"]
+        line_errors.append(line_error)
+    return ValidationError.from_exception_data(error.title, line_errors)
+
+
 class BaseClient:
     def __init__(self, auth_client):
         self.auth = auth_client
 
-    def _post(self, endpoint, payload, include_supplier_id=True, include_mode=True):
-        params = {}
-        if include_supplier_id and self.auth.supplier_id:
-            params["supplier_id"] = self.auth.supplier_id
-        if include_mode and self.auth.mode:
-            payload["mode"] = self.auth.mode
+    def _require_auth(self):
+        # AuthClient keeps _ready in step with its session and supplier_id
+        if not self.auth._ready:
+            raise ValueError("Must be authenticated before making this call")
+
+    def _post(self, endpoint, payload, include_supplier_id=True, include_mode=True, url=None):
+        return self._with_relogin(self._post_once, endpoint, payload, include_supplier_id, include_mode, url)
 
-        url = f"{self.auth.base_url}{endpoint}"
-        if params:
-            from urllib.parse import urlencode
-            url += "?" + urlencode(params)
+    def _with_relogin(self, send, *args):
+        """Call send(*args), logging in again and replaying it once if it raises PermissionError."""
+        try:
+            return send(*args)
+        except PermissionError as expired:
+            # The ksi has most likely expired: log in again, bypassing the
+            # login cache, and replay the request once
+            try:
+                self.auth.authenticate(force=True)
+            except PermissionError:
+                raise expired
+            return send(*args)
+
+    def _post_once(self, endpoint, payload, include_supplier_id, include_mode, url):
+        if include_mode and self.auth.mode:
+            if isinstance(payload, bytes):
+                raise ValueError("Cannot add mode to a pre-serialized payload; pass include_mode=False")
+            payload = {**payload, "mode": self.auth.mode}
 
-        response = self.auth.session.post(url, json=payload)
-        if response.status_code == 401:
-            raise PermissionError("Not authenticated.")
-        elif response.status_code == 400:
-            raise ValueError(f"Bad request: {response.text}")
+        # Callers may pass a URL prebuilt by the auth client
+        if url is None:
+            supplier_id = self.auth.supplier_id if include_supplier_id else None
+            url = _endpoint_url(self.auth.base_url, endpoint, supplier_id)
 
-        response.raise_for_status()
-        return response.json()
+        # Pre-serialized JSON bodies are sent as-is without re-encoding
+        body = payload if isinstance(payload, bytes) else dumps(payload)
+        return _read_response(self.auth.session.post(url, data=body, headers=_JSON_HEADERS))
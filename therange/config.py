@@ -4,11 +4,14 @@ Configuration module for The Range Marketplace SDK.
 Provides configurable environment settings for production and UAT environments.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
 class EnvironmentConfig:
-    """Configuration for a specific environment."""
+    """Configuration for a specific environment (immutable once created)."""
+    
+    __slots__ = ("base_url", "name")
     
     def __init__(self, base_url: str, name: str = ""):
         """
@@ -18,28 +21,61 @@ class EnvironmentConfig:
             base_url: The base URL for API endpoints
             name: Optional name for the environment (e.g., "production", "uat")
         """
-        self.base_url = base_url.rstrip("/") + "/"  # Ensure consistent trailing slash
-        self.name = name
+        if not base_url.endswith("/") or base_url.endswith("//"):
+            base_url = base_url.rstrip("/") + "/"  # Ensure consistent trailing slash
+        object.__setattr__(self, "base_url", base_url)
+        object.__setattr__(self, "name", name)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    # Rebuilt through __init__, since the default slot restore goes through __setattr__
+    def __reduce__(self):
+        return (type(self), (self.base_url, self.name))
+    
+    # Immutable, so a copy can be the instance itself
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
     
     def __repr__(self):
         return f"EnvironmentConfig(name='{self.name}', base_url='{self.base_url}')"
 
 
 class Config:
-    """Main configuration class for The Range Marketplace SDK."""
+    """Main configuration class for The Range Marketplace SDK (immutable once created)."""
+    
+    __slots__ = ("environment", "pool_maxsize")
     
     # Predefined environments
     PRODUCTION = EnvironmentConfig("https://supplier.rstore.com/rest", "production")
     UAT = EnvironmentConfig("https://uatsupplier.rstore.com/rest", "uat")
     
-    def __init__(self, environment: Optional[EnvironmentConfig] = None):
+    def __init__(self, environment: Optional[EnvironmentConfig] = None, pool_maxsize: int = 32):
         """
         Initialize configuration.
         
         Args:
             environment: Environment configuration to use. Defaults to PRODUCTION.
+            pool_maxsize: Maximum pooled connections kept open to the API host;
+                size it to the number of threads issuing requests concurrently.
         """
-        self.environment = environment or self.PRODUCTION
+        object.__setattr__(self, "environment", environment or self.PRODUCTION)
+        object.__setattr__(self, "pool_maxsize", pool_maxsize)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __reduce__(self):
+        return (type(self), (self.environment, self.pool_maxsize))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
     
     @property
     def base_url(self) -> str:
@@ -52,25 +88,31 @@ class Config:
         return self.environment.name == "uat"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def production(cls) -> "Config":
-        """Create a production configuration."""
+        """Return the shared production configuration (built once per class)."""
         return cls(cls.PRODUCTION)
     
     @classmethod
+    @lru_cache(maxsize=None)
     def uat(cls) -> "Config":
-        """Create a UAT (test) configuration."""
+        """Return the shared UAT (test) configuration (built once per class)."""
         return cls(cls.UAT)
     
     @classmethod
-    def custom(cls, base_url: str, name: str = "custom") -> "Config":
+    @lru_cache(maxsize=32)
+    def custom(cls, base_url: str, name: str = "custom", pool_maxsize: int = 32) -> "Config":
         """
-        Create a custom configuration with specified base URL.
+        Return a custom configuration with specified base URL.
+        
+        Repeated calls with the same arguments return the same cached instance.
         
         Args:
             base_url: The base URL for API endpoints
             name: Optional name for the environment
+            pool_maxsize: Maximum pooled connections kept open to the API host
         """
-        return cls(EnvironmentConfig(base_url, name))
+        return cls(EnvironmentConfig(base_url, name), pool_maxsize=pool_maxsize)
     
     def __repr__(self):
         return f"Config(environment={self.environment})"
\ No newline at end of file
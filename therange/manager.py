@@ -1,12 +1,18 @@
+from importlib import import_module
 from .auth import AuthClient
-from .order_feed import OrderFeedClient
-from .order_ack import OrderAckClient
-from .order_event import OrderEventClient
-from .stock_availability import StockAvailabilityClient
-from .product_feed import ProductFeedClient
 from .config import Config
 
 class TheRangeManager:
+    # Sub-client attribute -> (module, class); each module (and pydantic with
+    # it) is imported the first time its attribute is accessed
+    _LAZY_CLIENTS = {
+        "order_feed": (".order_feed", "OrderFeedClient"),
+        "order_ack": (".order_ack", "OrderAckClient"),
+        "order_event": (".order_event", "OrderEventClient"),
+        "stock_availability": (".stock_availability", "StockAvailabilityClient"),
+        "product_feed": (".product_feed", "ProductFeedClient"),
+    }
+
     def __init__(self, username, password, config: Config):
         """
         Initialize TheRangeManager.
@@ -17,11 +23,16 @@ class TheRangeManager:
             config: Configuration object specifying the environment to use
         """
         self.auth = AuthClient(username, password, config)
-        self.order_feed = OrderFeedClient(self.auth)
-        self.order_ack = OrderAckClient(self.auth)
-        self.order_event = OrderEventClient(self.auth)
-        self.stock_availability = StockAvailabilityClient(self.auth)
-        self.product_feed = ProductFeedClient(self.auth)
+
+    def __getattr__(self, name):
+        # Only called for attributes not yet set on the instance
+        try:
+            module, cls = self._LAZY_CLIENTS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        client = getattr(import_module(module, __package__), cls)(self.auth)
+        setattr(self, name, client)
+        return client
 
     def authenticate(self):
         return self.auth.authenticate()
@@ -1,27 +1,37 @@
-from pydantic import BaseModel, Field, validator
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from typing import List
 from .base_client import BaseClient
 
+# Interned once so endpoint-keyed cache lookups compare by identity
+_ORDER_ACK_API = sys.intern("order_ack.api")
+
 
 class OrderAckRequest(BaseModel):
     """Pydantic model for order acknowledgment request validation."""
     order_arr: List[str] = Field(..., description="List of order numbers to acknowledge")
     
-    @validator('order_arr')
+    @field_validator('order_arr')
+    @classmethod
     def validate_order_arr(cls, v):
-        """Validate that order_arr is a non-empty list of strings."""
-        if not isinstance(v, list):
-            raise ValueError("order_arr must be a list")
+        """Validate that order_arr is non-empty with no blank order IDs; the field type enforces list of str."""
         if not v:
             raise ValueError("order_arr must be a non-empty list")
         for order_id in v:
-            if not isinstance(order_id, str):
-                raise ValueError("All order IDs must be strings")
             if not order_id.strip():
                 raise ValueError("Order IDs cannot be empty strings")
         return v
 
 
+def _validated_order_numbers(order_numbers):
+    """Validate order numbers with OrderAckRequest and return them as a list."""
+    try:
+        return OrderAckRequest(order_arr=order_numbers).order_arr
+    except ValidationError as e:
+        raise ValueError(f"Invalid order_numbers: {e}")
+
+
 class OrderAckClient(BaseClient):
     def acknowledge_orders(self, order_numbers: List[str]):
         """Acknowledge orders received via order_feed.api with type='new'.
@@ -36,19 +46,40 @@ class OrderAckClient(BaseClient):
             ValueError: If authentication state is invalid or order_numbers is invalid
             PermissionError: If not authenticated (401)
         """
-        # Create and validate request using Pydantic model first
-        try:
-            request = OrderAckRequest(order_arr=order_numbers)
-        except Exception as e:
-            raise ValueError(f"Invalid order_numbers: {e}")
+        order_arr = _validated_order_numbers(order_numbers)
         
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
+        
+        return self._post(_ORDER_ACK_API, {"order_arr": order_arr})
+    
+    def acknowledge_orders_bulk(self, order_numbers: List[str], chunk_size: int = 500, max_workers: int = 8):
+        """Acknowledge a large list of orders in chunks sent concurrently.
+        
+        The whole list is validated before anything is sent. Each chunk is an
+        independent API call, so one failure does not stop the others; its
+        exception is returned in place of a response.
+        
+        Args:
+            order_numbers: List of order numbers (strings) to acknowledge
+            chunk_size: Maximum number of order numbers per request
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            List holding, for each chunk in input order, the API response or
+            the exception raised while sending it
+            
+        Raises:
+            ValueError: If authentication state is invalid or order_numbers is invalid
+        """
+        order_arr = _validated_order_numbers(order_numbers)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
         
-        # Convert to dict for API call
-        payload = request.model_dump()
+        # Validate authentication state
+        self._require_auth()
         
-        return self._post("order_ack.api", payload)
+        payloads = [{"order_arr": order_arr[i:i + chunk_size]} for i in range(0, len(order_arr), chunk_size)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(payloads))) as executor:
+            futures = [executor.submit(self._post, _ORDER_ACK_API, payload) for payload in payloads]
+        return [future.exception() or future.result() for future in futures]
@@ -1,17 +1,54 @@
-from pydantic import BaseModel, Field, validator
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from typing import List, Optional
-from datetime import datetime
+from ._dates import DATETIME_RE, is_date
 from .base_client import BaseClient
 
+# Interned once so endpoint-keyed cache lookups compare by identity
+_ORDER_EVENT_API = sys.intern("order_event.api")
 
-class OrderItem(BaseModel):
-    """Model for individual order line items."""
-    code: str = Field(..., description="Product code")
-    qty: int = Field(..., ge=1, description="Quantity, must be >= 1")
+_CANCEL_CODES = frozenset({
+    "Stock not available",
+    "Unable to contact customer to arrange delivery",
+    "Unable to deliver to address",
+})
+
+
+@dataclass(frozen=True)
+class OrderItem:
+    """Individual order line item: a product code and a quantity of at least 1.
+    
+    A plain slotted dataclass rather than a Pydantic model, since it is built
+    once per line of every dispatch and cancellation.
+    """
+    __slots__ = ("code", "qty")
+    code: str
+    qty: int
+
+    def __post_init__(self):
+        if not isinstance(self.code, str) or not self.code:
+            raise ValueError("code must be a non-empty string")
+        if type(self.qty) is not int or self.qty < 1:
+            raise ValueError("qty must be an integer >= 1")
+
+
+def _order_items(items):
+    """Build OrderItems from item dicts (OrderItems pass through) for the request models."""
+    if not isinstance(items, (list, tuple)) or not items:
+        raise ValueError("items must be a non-empty list")
+    try:
+        return [item if isinstance(item, OrderItem) else OrderItem(**item) for item in items]
+    except TypeError as e:
+        # Missing, unknown or non-mapping item fields
+        raise ValueError(f"invalid item: {e}") from e
 
 
 class DispatchOrderRequest(BaseModel):
     """Pydantic model for dispatch order request validation."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     order_number: str = Field(..., description="Order number to dispatch")
     items: List[OrderItem] = Field(..., description="List of items to dispatch")
     despatch_date: str = Field(..., description="Dispatch date in format YYYY-MM-DD HH:MM:SS")
@@ -21,63 +58,115 @@ class DispatchOrderRequest(BaseModel):
     earliest_delivery: Optional[str] = Field(None, description="Earliest delivery date in format YYYY-MM-DD")
     latest_delivery: Optional[str] = Field(None, description="Latest delivery date in format YYYY-MM-DD")
     
-    @validator('items')
+    @field_validator('items', mode='before')
+    @classmethod
     def validate_items(cls, v):
-        """Validate that items is a non-empty list."""
-        if not v:
-            raise ValueError("items must be a non-empty list")
-        return v
+        """Validate that items is a non-empty list of OrderItems or item dicts."""
+        return _order_items(v)
     
-    @validator('despatch_date')
+    @field_validator('despatch_date')
+    @classmethod
     def validate_despatch_date(cls, v):
         """Validate despatch_date format."""
-        try:
-            datetime.strptime(v, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
+        if not is_date(v, DATETIME_RE):
             raise ValueError("despatch_date must be in format YYYY-MM-DD HH:MM:SS")
         return v
     
-    @validator('earliest_delivery', 'latest_delivery')
+    @field_validator('earliest_delivery', 'latest_delivery')
+    @classmethod
     def validate_delivery_dates(cls, v):
         """Validate delivery date format."""
-        if v is not None:
-            try:
-                datetime.strptime(v, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError("delivery dates must be in format YYYY-MM-DD")
+        if v is not None and not is_date(v):
+            raise ValueError("delivery dates must be in format YYYY-MM-DD")
         return v
 
 
 class CancelOrderRequest(BaseModel):
     """Pydantic model for cancel order request validation."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     order_number: str = Field(..., description="Order number to cancel")
     items: List[OrderItem] = Field(..., description="List of items to cancel")
     cancel_code: str = Field(..., description="Cancellation code")
     cancel_reason: str = Field("", description="Optional cancellation reason")
     
-    @validator('items')
+    @field_validator('items', mode='before')
+    @classmethod
     def validate_items(cls, v):
-        """Validate that items is a non-empty list."""
-        if not v:
-            raise ValueError("items must be a non-empty list")
-        return v
+        """Validate that items is a non-empty list of OrderItems or item dicts."""
+        return _order_items(v)
     
-    @validator('cancel_code')
+    @field_validator('cancel_code')
+    @classmethod
     def validate_cancel_code(cls, v):
         """Validate cancel_code is one of the allowed values."""
-        allowed_codes = [
-            "Stock not available",
-            "Unable to contact customer to arrange delivery",
-            "Unable to deliver to address"
-        ]
-        if v not in allowed_codes:
-            raise ValueError(f"cancel_code must be one of {allowed_codes}")
+        if v not in _CANCEL_CODES:
+            raise ValueError(f"cancel_code must be one of {sorted(_CANCEL_CODES)}")
         return v
 
 
+def _dispatch_payload(order_number, items, despatch_date, delivery_service, courier_name,
+                      tracking_reference, earliest_delivery=None, latest_delivery=None):
+    """Validate a dispatch and build its order_event.api payload."""
+    # Create and validate request using Pydantic model
+    try:
+        request = DispatchOrderRequest(
+            order_number=order_number,
+            items=items,
+            despatch_date=despatch_date,
+            delivery_service=delivery_service,
+            courier_name=courier_name,
+            tracking_reference=tracking_reference,
+            earliest_delivery=earliest_delivery,
+            latest_delivery=latest_delivery
+        )
+    except ValidationError as e:
+        raise ValueError(f"Invalid dispatch request: {e}")
+    
+    # Build the API payload straight from the validated fields, renaming items to item_arr
+    payload = {
+        "order_number": request.order_number,
+        "delivery_service": request.delivery_service,
+        "courier_name": request.courier_name,
+        "despatch_date": request.despatch_date,
+        "tracking_reference": request.tracking_reference,
+        "item_arr": [{"code": item.code, "qty": item.qty} for item in request.items]
+    }
+    
+    # Add optional delivery dates if provided
+    if request.earliest_delivery:
+        payload["earliest_delivery"] = request.earliest_delivery
+    if request.latest_delivery:
+        payload["latest_delivery"] = request.latest_delivery
+    
+    return payload
+
+
+def _cancel_payload(order_number, items, cancel_code, cancel_reason=""):
+    """Validate a cancellation and build its order_event.api payload."""
+    # Create and validate request using Pydantic model
+    try:
+        request = CancelOrderRequest(
+            order_number=order_number,
+            items=items,
+            cancel_code=cancel_code,
+            cancel_reason=cancel_reason
+        )
+    except ValidationError as e:
+        raise ValueError(f"Invalid cancel request: {e}")
+    
+    # Build the API payload straight from the validated fields, renaming items to item_arr
+    return {
+        "order_number": request.order_number,
+        "cancel_code": request.cancel_code,
+        "cancel_reason": request.cancel_reason,
+        "item_arr": [{"code": item.code, "qty": item.qty} for item in request.items]
+    }
+
+
 class OrderEventClient(BaseClient):
     def send_event(self, event_payload):
-        return self._post("order_event.api", event_payload)
+        return self._post(_ORDER_EVENT_API, event_payload)
     
     def dispatch_order(self, order_number: str, items: list, despatch_date: str, delivery_service: str,
                        courier_name: str, tracking_reference: str, earliest_delivery: str = None,
@@ -102,46 +191,34 @@ class OrderEventClient(BaseClient):
             PermissionError: If not authenticated (401)
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
-        
-        # Create and validate request using Pydantic model
-        try:
-            request = DispatchOrderRequest(
-                order_number=order_number,
-                items=items,
-                despatch_date=despatch_date,
-                delivery_service=delivery_service,
-                courier_name=courier_name,
-                tracking_reference=tracking_reference,
-                earliest_delivery=earliest_delivery,
-                latest_delivery=latest_delivery
-            )
-        except Exception as e:
-            raise ValueError(f"Invalid dispatch request: {e}")
+        self._require_auth()
         
-        # Convert to dict and restructure for API call
-        request_dict = request.model_dump(exclude_none=True)
+        payload = _dispatch_payload(
+            order_number, items, despatch_date, delivery_service, courier_name,
+            tracking_reference, earliest_delivery, latest_delivery
+        )
         
-        # Transform items to item_arr as expected by API
-        payload = {
-            "order_number": request_dict["order_number"],
-            "delivery_service": request_dict["delivery_service"],
-            "courier_name": request_dict["courier_name"],
-            "despatch_date": request_dict["despatch_date"],
-            "tracking_reference": request_dict["tracking_reference"],
-            "item_arr": [{"code": item.code, "qty": item.qty} for item in request.items]
-        }
+        return self._post(_ORDER_EVENT_API, payload)
+    
+    def dispatch_orders(self, dispatches: List[dict], max_workers: int = 8):
+        """Dispatch many orders concurrently over the shared pooled session.
         
-        # Add optional delivery dates if provided
-        if request_dict.get("earliest_delivery"):
-            payload["earliest_delivery"] = request_dict["earliest_delivery"]
-        if request_dict.get("latest_delivery"):
-            payload["latest_delivery"] = request_dict["latest_delivery"]
+        Each dispatch is an independent API call, so one failure does not stop
+        the others; its exception is returned in place of a response.
         
-        return self._post("order_event.api", payload)
+        Args:
+            dispatches: List of dicts of dispatch_order keyword arguments
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            List holding, for each dispatch in input order, the API response or
+            the exception dispatch_order raised for it
+        """
+        if not dispatches:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(dispatches))) as executor:
+            futures = [executor.submit(self.dispatch_order, **dispatch) for dispatch in dispatches]
+        return [future.exception() or future.result() for future in futures]
     
     def cancel_order(self, order_number: str, items: list, cancel_code: str, cancel_reason: str = ""):
         """Cancel an order by sending a cancellation event.
@@ -160,31 +237,8 @@ class OrderEventClient(BaseClient):
             PermissionError: If not authenticated (401)
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
-        
-        # Create and validate request using Pydantic model
-        try:
-            request = CancelOrderRequest(
-                order_number=order_number,
-                items=items,
-                cancel_code=cancel_code,
-                cancel_reason=cancel_reason
-            )
-        except Exception as e:
-            raise ValueError(f"Invalid cancel request: {e}")
-        
-        # Convert to dict and restructure for API call
-        request_dict = request.model_dump()
+        self._require_auth()
         
-        # Transform items to item_arr as expected by API
-        payload = {
-            "order_number": request_dict["order_number"],
-            "cancel_code": request_dict["cancel_code"],
-            "cancel_reason": request_dict["cancel_reason"],
-            "item_arr": [{"code": item.code, "qty": item.qty} for item in request.items]
-        }
+        payload = _cancel_payload(order_number, items, cancel_code, cancel_reason)
         
-        return self._post("order_event.api", payload)
+        return self._post(_ORDER_EVENT_API, payload)
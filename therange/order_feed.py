@@ -1,42 +1,43 @@
-from pydantic import BaseModel, Field, validator
+import sys
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, ValidationInfo, field_validator
 from typing import Optional
-from datetime import datetime
-from .base_client import BaseClient
+from typing_extensions import Literal
+from ._dates import parse_datetime
+from ._json import dumps, loads
+from .base_client import BaseClient, _JSON_HEADERS, _check_response, _endpoint_url
+
+# Interned once so endpoint-keyed cache lookups compare by identity
+_ORDER_FEED_API = sys.intern("order_feed.api")
 
 
 class OrderFeedRequest(BaseModel):
     """Pydantic model for order feed request validation."""
     search: Optional[str] = None
-    type: str = Field(default="all", description="Order type filter")
-    from_date: Optional[str] = Field(alias="from", default=None, description="Start date for filtering")
-    to_date: Optional[str] = Field(alias="to", default=None, description="End date for filtering")
-    
-    @validator('type')
-    def validate_type(cls, v):
-        """Validate that type is one of the allowed values."""
-        allowed_types = ["all", "new", "pending", "historic"]
-        if v not in allowed_types:
-            raise ValueError(f"type must be one of {allowed_types}, got '{v}'")
-        return v
+    type: Literal["all", "new", "pending", "historic"] = Field(default="all", description="Order type filter")
+    from_date: Optional[str] = Field(
+        validation_alias="from", serialization_alias="from", default=None, description="Start date for filtering"
+    )
+    to_date: Optional[str] = Field(
+        validation_alias="to", serialization_alias="to", default=None, description="End date for filtering"
+    )
     
-    @validator('to_date')
-    def validate_date_range(cls, v, values):
+    @field_validator('to_date', mode='after')
+    @classmethod
+    def validate_date_range(cls, v, info: ValidationInfo):
         """Validate that date range doesn't exceed 35 days."""
-        if v is not None and 'from_date' in values and values['from_date'] is not None:
-            try:
-                from_dt = datetime.strptime(values['from_date'], '%Y-%m-%d %H:%M:%S')
-                to_dt = datetime.strptime(v, '%Y-%m-%d %H:%M:%S')
-                delta = to_dt - from_dt
-                if delta.days > 35:
-                    raise ValueError("Date range cannot exceed 35 days")
-            except ValueError as e:
-                if "Date range cannot exceed 35 days" in str(e):
-                    raise e
-                # If parsing fails, let it slide for now (optional validation)
-                pass
+        if v is not None and info.data.get('from_date') is not None:
+            from_dt = parse_datetime(info.data['from_date'])
+            to_dt = parse_datetime(v)
+            # Unparseable dates are let through (optional validation)
+            if from_dt is not None and to_dt is not None and (to_dt - from_dt).days > 35:
+                raise ValueError("Date range cannot exceed 35 days")
         return v
 
 
+# Built once at import so each call reuses the compiled request validator
+_ORDER_FEED_ADAPTER = TypeAdapter(OrderFeedRequest)
+
+
 class OrderFeedClient(BaseClient):
     def get_orders(self, search=None, type="all", from_date=None, to_date=None):
         """Get orders from the order feed API with optional filtering.
@@ -54,23 +55,76 @@ class OrderFeedClient(BaseClient):
             ValueError: If authentication state is invalid or parameters are invalid
             PermissionError: If not authenticated (401)
         """
+        payload = self._feed_payload(search, type, from_date, to_date)
+        
+        return self._post(_ORDER_FEED_API, payload)
+    
+    def iter_orders(self, search=None, type="all", from_date=None, to_date=None):
+        """Iterate over orders from the order feed as the response streams in.
+        
+        Takes the same filters as get_orders. With the optional ``ijson``
+        dependency (``pip install therange-sdk[stream]``) the response is
+        parsed incrementally, so memory stays flat however large the feed is;
+        without it the body is read in full and its orders yielded in turn.
+        
+        Returns:
+            Iterator over the order dicts in the response's order_arr
+            
+        Raises:
+            ValueError: If authentication state is invalid or parameters are invalid
+            PermissionError: If not authenticated (401)
+        """
+        # Validate eagerly, so bad filters raise here rather than on first iteration
+        payload = self._feed_payload(search, type, from_date, to_date)
+        return self._stream_orders(payload)
+    
+    def _stream_orders(self, payload):
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        # Re-logs in and replays on 401, as _post does for get_orders
+        response = self._with_relogin(self._open_order_stream, payload)
+        try:
+            if ijson is None:
+                yield from loads(response.content).get("order_arr") or []
+                return
+            # Let urllib3 undo any gzip/deflate before ijson reads the raw stream
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "order_arr.item", use_float=True)
+        finally:
+            response.close()
+    
+    def _open_order_stream(self, payload):
+        """Send the streaming order feed request with the current login, closing the response if it failed."""
+        if self.auth.mode:
+            payload = {**payload, "mode": self.auth.mode}
+        url = _endpoint_url(self.auth.base_url, _ORDER_FEED_API, self.auth.supplier_id)
+        response = self.auth.session.post(url, data=dumps(payload), headers=_JSON_HEADERS, stream=True)
+        try:
+            _check_response(response)
+        except BaseException:
+            response.close()
+            raise
+        return response
+    
+    def _feed_payload(self, search, type, from_date, to_date):
+        """Check authentication, validate the filters and build the order_feed.api payload."""
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
         
-        # Create and validate request using Pydantic model
+        # Build the aliased payload up front, leaving out filters that were not given
+        payload = {} if search is None else {"search": search}
+        payload["type"] = type
+        if from_date is not None:
+            payload["from"] = from_date
+        if to_date is not None:
+            payload["to"] = to_date
+        
+        # The validators check without transforming, so the payload is sent as built
         try:
-            request = OrderFeedRequest(
-                search=search,
-                type=type,
-                **{"from": from_date, "to": to_date}
-            )
-        except Exception as e:
+            _ORDER_FEED_ADAPTER.validate_python(payload)
+        except ValidationError as e:
             raise ValueError(f"Invalid parameters: {e}")
         
-        # Convert to dict for API call, excluding None values
-        payload = request.model_dump(by_alias=True, exclude_none=True)
-        
-        return self._post("order_feed.api", payload)
+        return payload
@@ -1,16 +1,39 @@
-from pydantic import BaseModel, HttpUrl, Field, ValidationError
+import sys
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, ValidationError
 from typing import List, Optional, Dict
+from typing_extensions import Annotated
 from datetime import date
-from .base_client import BaseClient
+from operator import methodcaller
+from .base_client import BaseClient, _last_per_key, _reindex_errors
+
+# Interned once so endpoint-keyed cache lookups compare by identity
+_PRODUCT_FEED_API = sys.intern("product_feed.api")
+
+_MAX_TITLE = 80
+_get_title = methodcaller("get", "title")
+
+# An http(s) URL checked by one regex compiled in pydantic-core and kept as
+# the string given, instead of being parsed and normalised like HttpUrl
+_HttpUrlStr = Annotated[str, StringConstraints(pattern=r"^https?://\S+$")]
+
+# The active and visible switches, which take 0 or 1
+_Flag = Annotated[int, Field(ge=0, le=1)]
+
+# The child hazard level, 0 to 2
+_ChildHazard = Annotated[int, Field(ge=0, le=2)]
 
 
 class PriceEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     price: float
     currency: str = "GBP"
     effective_from: date
 
 
 class ProductAttribute(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     colour: Optional[str] = None
     colour_name: Optional[str] = None
     colour_group: Optional[str] = None
@@ -22,24 +45,26 @@ class ProductAttribute(BaseModel):
 
 
 class ProductEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     vendor_sku: str
     related_product: Optional[str] = None
-    title: str = Field(..., max_length=80)
+    title: str = Field(..., max_length=_MAX_TITLE)
     brand: str
     gtin: Optional[str] = None
     price_arr: List[PriceEntry]
     product_category: str
     description: str
     feature_arr: Optional[List[str]] = Field(default_factory=list)
-    child_hazard: Optional[int] = None
+    child_hazard: Optional[_ChildHazard] = None
     age_restriction: Optional[str] = None
-    image_url_arr: List[HttpUrl]
-    youtube_url_arr: Optional[List[HttpUrl]] = Field(default_factory=list)
+    image_url_arr: List[_HttpUrlStr]
+    youtube_url_arr: Optional[List[_HttpUrlStr]] = Field(default_factory=list)
     fulfilment_class: str
     product_attribute: Optional[ProductAttribute] = None
     launch_date: Optional[date] = None
-    active: Optional[int] = None
-    visible: Optional[int] = None
+    active: Optional[_Flag] = None
+    visible: Optional[_Flag] = None
 
 
 class ProductFeedRequest(BaseModel):
@@ -47,6 +72,8 @@ class ProductFeedRequest(BaseModel):
 
 
 class PriceAmendmentEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
     vendor_sku: str
     price_arr: List[PriceEntry]
 
@@ -55,6 +82,11 @@ class PriceAmendmentRequest(BaseModel):
     product_arr: List[PriceAmendmentEntry]
 
 
+# Built once at import so each call reuses the compiled request validators
+_PRODUCT_FEED_ADAPTER = TypeAdapter(ProductFeedRequest)
+_PRICE_AMENDMENT_ADAPTER = TypeAdapter(PriceAmendmentRequest)
+
+
 class ProductFeedClient(BaseClient):
     def submit_products(self, product_arr):
         """Legacy method for submitting products with basic validation.
@@ -70,12 +102,30 @@ class ProductFeedClient(BaseClient):
         """
         if not isinstance(product_arr, list):
             raise ValueError("product_arr must be a list")
-        for p in product_arr:
-            title = p.get("title")
-            if title and len(title) > 80:
-                raise ValueError(f"Product title exceeds 80 characters: {title}")
+        # map() fetches every title in C; only the length test runs per product in Python
+        too_long = next((t for t in map(_get_title, product_arr) if t and len(t) > _MAX_TITLE), None)
+        if too_long:
+            raise ValueError(f"Product title exceeds {_MAX_TITLE} characters: {too_long}")
+
+        return self._post(_PRODUCT_FEED_API, {"product_arr": product_arr}, include_mode=False)
 
-        return self._post("product_feed.api", {"product_arr": product_arr}, include_mode=False)
+    def submit_products_validated(self, entries: List[ProductEntry]):
+        """Submit ProductEntry models without re-validating them.
+
+        The models already enforce every field constraint, including the
+        title length, so neither the legacy title scan nor a second Pydantic
+        pass is run.
+
+        Args:
+            entries: List of ProductEntry instances
+
+        Returns:
+            API response
+
+        Raises:
+            ValueError: If authentication state is invalid
+        """
+        return self.send_product_feed(ProductFeedRequest.model_construct(product_arr=entries))
 
     def send_product_feed(self, request: ProductFeedRequest):
         """Send product feed using Pydantic validation.
@@ -90,21 +140,19 @@ class ProductFeedClient(BaseClient):
             ValueError: If authentication state is invalid
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
         
-        # Convert to dict for API call
-        payload = request.model_dump()
+        # Serialize straight to JSON bytes with pydantic-core, skipping the dict step
+        body = _PRODUCT_FEED_ADAPTER.dump_json(request)
         
-        return self._post("product_feed.api", payload, include_mode=False)
+        return self._post(_PRODUCT_FEED_API, body, include_mode=False)
 
-    def send_product_feed_dict(self, product_data: List[dict]):
+    def send_product_feed_dict(self, product_data: List[dict], dedupe: bool = True):
         """Send product feed from list of dictionaries with Pydantic validation.
         
         Args:
             product_data: List of product dictionaries to validate and send
+            dedupe: Send only the last product for each repeated vendor_sku
             
         Returns:
             API response
@@ -113,25 +161,76 @@ class ProductFeedClient(BaseClient):
             ValueError: If validation fails or authentication state is invalid
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
         
         # Validate data is a non-empty list
         if not isinstance(product_data, list):
             raise ValueError("product_data must be a list")
         if not product_data:
             raise ValueError("product_data must be a non-empty list")
+        rows = product_data
+        if dedupe:
+            product_data = _last_per_key(product_data, "vendor_sku")
         
         # Validate using Pydantic
         try:
-            request = ProductFeedRequest(product_arr=product_data)
+            request = _PRODUCT_FEED_ADAPTER.validate_python({"product_arr": product_data})
         except ValidationError as e:
+            # Report the index each bad product had in the list given
+            if product_data is not rows:
+                e = _reindex_errors(e, product_data, rows, depth=1)
             raise ValueError(f"Invalid product data: {e}")
         
         return self.send_product_feed(request)
 
+    def send_product_feed_chunked(self, product_data: List[dict], chunk_size: int = 500, dedupe: bool = True):
+        """Send a large product feed as a sequence of bounded-size feeds.
+
+        Each chunk is validated and posted before the next is touched, so only
+        one chunk's models are alive at a time. A chunk that fails validation
+        or is rejected by the API does not stop the chunks after it; failed
+        authentication, or any other error, does.
+
+        Args:
+            product_data: List of product dictionaries to validate and send
+            chunk_size: Maximum number of products per request
+            dedupe: Send only the last product for each repeated vendor_sku,
+                across the whole feed rather than per chunk
+
+        Returns:
+            List holding, for each chunk in order, the API response or the
+            ValueError or requests.HTTPError raised while validating or
+            sending it
+
+        Raises:
+            ValueError: If authentication state is invalid, product_data is not
+                a non-empty list or chunk_size is less than 1
+            PermissionError: If the credentials are rejected
+        """
+        # Imported here so importing the client does not pull in requests
+        from requests import HTTPError
+
+        # Validate authentication state
+        self._require_auth()
+
+        # Validate data is a non-empty list
+        if not isinstance(product_data, list):
+            raise ValueError("product_data must be a list")
+        if not product_data:
+            raise ValueError("product_data must be a non-empty list")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if dedupe:
+            product_data = _last_per_key(product_data, "vendor_sku")
+
+        results = []
+        for i in range(0, len(product_data), chunk_size):
+            try:
+                results.append(self.send_product_feed_dict(product_data[i:i + chunk_size], dedupe=False))
+            except (ValueError, HTTPError) as e:
+                results.append(e)
+        return results
+
     def send_price_amendment(self, request: PriceAmendmentRequest):
         """Send price-only amendment request.
         
@@ -145,15 +244,12 @@ class ProductFeedClient(BaseClient):
             ValueError: If authentication state is invalid
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
         
-        # Convert to dict for API call
-        payload = request.model_dump()
+        # Serialize straight to JSON bytes with pydantic-core, skipping the dict step
+        body = _PRICE_AMENDMENT_ADAPTER.dump_json(request)
         
-        return self._post("product_feed.api", payload, include_mode=False)
+        return self._post(_PRODUCT_FEED_API, body, include_mode=False)
 
     def send_price_amendment_dict(self, price_data: List[dict]):
         """Send price-only amendment from list of dictionaries with Pydantic validation.
@@ -168,10 +264,7 @@ class ProductFeedClient(BaseClient):
             ValueError: If validation fails or authentication state is invalid
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
+        self._require_auth()
         
         # Validate data is a non-empty list
         if not isinstance(price_data, list):
@@ -181,7 +274,7 @@ class ProductFeedClient(BaseClient):
         
         # Validate using Pydantic
         try:
-            request = PriceAmendmentRequest(product_arr=price_data)
+            request = _PRICE_AMENDMENT_ADAPTER.validate_python({"product_arr": price_data})
         except ValidationError as e:
             raise ValueError(f"Invalid price data: {e}")
         
@@ -1,43 +1,154 @@
-from typing import List
-from pydantic import BaseModel, Field, ValidationError
-from .base_client import BaseClient
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+from pydantic import BaseModel, ConfigDict, Field, Strict, TypeAdapter, ValidationError, conlist
+from pydantic_core import to_json
+from typing_extensions import Annotated
+from ._fastvalidate import is_canonical_stock as _validate_fast
+from .base_client import BaseClient, _last_per_key, _reindex_errors
 
 
 class StockItem(BaseModel):
     """Model for individual stock availability item."""
-    code: str = Field(..., description="Product code used to identify a product")
-    qty: int = Field(..., ge=0, description="Quantity of stock on hand, including awaiting despatch")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    code: Annotated[str, Field(description="Product code used to identify a product")]
+    qty: Annotated[int, Field(ge=0, description="Quantity of stock on hand, including awaiting despatch")]
+
+
+# Built once at import so each call reuses the compiled list validator. The
+# list itself must be a real, non-empty list; its rows are validated as usual.
+_STOCK_ADAPTER = TypeAdapter(Annotated[conlist(StockItem, min_length=1), Strict()])
+
+# Top-level list errors reported with the messages update_stock has always used
+_STOCK_LIST_ERRORS = {
+    "list_type": "stock_data must be a list",
+    "too_short": "stock_data must be a non-empty list",
+}
+
+
+def _validate_stock(validate, stock_data, rows=None):
+    """Run an _STOCK_ADAPTER validate method, raising ValueError on invalid stock data.
+    
+    rows, when given, are the rows stock_data was deduplicated from, and
+    errors are reported against their indices.
+    """
+    try:
+        return validate(stock_data)
+    except ValidationError as e:
+        if rows is not None and rows is not stock_data:
+            e = _reindex_errors(e, stock_data, rows)
+        for error in e.errors():
+            if not error["loc"] and error["type"] in _STOCK_LIST_ERRORS:
+                raise ValueError(_STOCK_LIST_ERRORS[error["type"]])
+        raise ValueError(f"Invalid stock data: {e}")
+
+
+_VALIDATE_MODES = ("fast", "strict")
+
+
+def _stock_rows(stock_data: List[dict], validate: str = "fast", dedupe: bool = True) -> list:
+    """Validate stock_data and return rows ready for serialization.
+    
+    With validate="fast", canonical rows are returned as-is; anything else,
+    and every row with validate="strict", goes through the TypeAdapter and
+    comes back as StockItem models. With dedupe, only the last row for each
+    code is kept; validation errors still give that row's index in stock_data.
+    """
+    if validate not in _VALIDATE_MODES:
+        raise ValueError(f"validate must be one of {_VALIDATE_MODES}, got '{validate}'")
+    
+    rows = stock_data
+    if dedupe and type(stock_data) is list:
+        stock_data = _last_per_key(stock_data, "code")
+    
+    # Non-empty lists of canonical rows need no model construction; anything
+    # else, including a non-list or empty list, is reported by Pydantic
+    if validate == "fast" and type(stock_data) is list and stock_data and _validate_fast(stock_data):
+        return stock_data
+    
+    # Validate every stock entry in a single Pydantic pass
+    return _validate_stock(_STOCK_ADAPTER.validate_python, stock_data, rows)
 
 
 class StockAvailabilityClient(BaseClient):
-    def update_stock(self, stock_data: List[dict]):
+    def update_stock(self, stock_data: List[dict], validate: str = "fast", dedupe: bool = True):
         """Update stock availability for products.
         
         Args:
             stock_data: List of dictionaries, each containing 'code' (str) and 'qty' (int >= 0)
+            validate: "fast" skips Pydantic when every row is already an exact
+                {'code': str, 'qty': int} dict; "strict" always validates with Pydantic
+            dedupe: Send only the last row for each repeated code
+            
+        Raises:
+            ValueError: If authentication state is invalid or stock_data validation fails
+        """
+        # Validate authentication state
+        self._require_auth()
+        
+        # to_json serializes plain dicts and StockItem models alike
+        return self._post_stock_body(to_json(_stock_rows(stock_data, validate, dedupe)))
+    
+    def update_stock_bulk(self, stock_data: List[dict], chunk_size: int = 500, max_workers: int = 8,
+                          validate: str = "fast", dedupe: bool = True):
+        """Update stock availability in chunks sent concurrently over the pooled session.
+        
+        The whole batch is validated before anything is sent, so one invalid
+        row fails the call before any chunk is posted. Once posting starts,
+        each chunk is an independent API call: one failure does not stop the
+        others, and its exception is returned in place of a response.
+        
+        Args:
+            stock_data: List of dictionaries, each containing 'code' (str) and 'qty' (int >= 0)
+            chunk_size: Maximum number of rows per request
+            max_workers: Maximum number of requests in flight at once
+            validate: "fast" or "strict", as for update_stock
+            dedupe: Send only the last row for each repeated code
+            
+        Returns:
+            List holding, for each chunk in input order, the API response or
+            the exception raised while sending it
             
         Raises:
             ValueError: If authentication state is invalid or stock_data validation fails
         """
         # Validate authentication state
-        if not self.auth.session:
-            raise ValueError("Must be authenticated before making this call")
-        if not self.auth.supplier_id:
-            raise ValueError("Must be authenticated before making this call")
-        
-        # Validate stock_data is a non-empty list
-        if not isinstance(stock_data, list):
-            raise ValueError("stock_data must be a list")
-        if not stock_data:
-            raise ValueError("stock_data must be a non-empty list")
-        
-        # Validate each stock entry using Pydantic
-        try:
-            validated_items = [StockItem(**item) for item in stock_data]
-        except ValidationError as e:
-            raise ValueError(f"Invalid stock data: {e}")
-        
-        # Convert back to list of dicts for API call
-        validated_data = [item.model_dump() for item in validated_items]
-        
-        return self._post("stock_availability.api", validated_data, include_mode=False)
+        self._require_auth()
+        
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        rows = _stock_rows(stock_data, validate, dedupe)
+        
+        bodies = [to_json(rows[i:i + chunk_size]) for i in range(0, len(rows), chunk_size)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(bodies))) as executor:
+            futures = [executor.submit(self._post_stock_body, body) for body in bodies]
+        return [future.exception() or future.result() for future in futures]
+    
+    def update_stock_json(self, stock_json: Union[str, bytes]):
+        """Update stock availability from a raw JSON array of stock items.
+        
+        Validates the JSON text directly, skipping the intermediate json.loads step.
+        
+        Args:
+            stock_json: JSON array of objects, each containing 'code' (str) and 'qty' (int >= 0)
+            
+        Raises:
+            ValueError: If authentication state is invalid or stock_json validation fails
+        """
+        # Validate authentication state
+        self._require_auth()
+        
+        validated_items = _validate_stock(_STOCK_ADAPTER.validate_json, stock_json)
+        
+        return self._send_stock(validated_items)
+    
+    def _send_stock(self, validated_items: List[StockItem]):
+        # Serialize straight to JSON bytes with pydantic-core
+        return self._post_stock_body(_STOCK_ADAPTER.dump_json(validated_items))
+    
+    def _post_stock_body(self, body: bytes):
+        return self._post(
+            "stock_availability.api", body, include_mode=False,
+            url=self.auth.endpoints.stock_url
+        )